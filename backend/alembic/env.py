@@ -8,7 +8,10 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from app.core.config import settings
 from app.core.database import Base
 from app.models.container import Container  # noqa: F401
+from app.models.hierarchy import ContainerClosure, ItemClosure  # noqa: F401
 from app.models.item import Item  # noqa: F401
+from app.models.item_summary import ItemSummary  # noqa: F401
+from app.models.stock_movement import StockMovement  # noqa: F401
 from app.models.user import User  # noqa: F401
 
 config = context.config
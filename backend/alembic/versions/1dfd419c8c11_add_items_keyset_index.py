@@ -0,0 +1,28 @@
+"""add items keyset index
+
+Revision ID: 1dfd419c8c11
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1dfd419c8c11"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_items_updated_at_id", "items", ["updated_at", "id"], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_items_updated_at_id", table_name="items", if_exists=True)
@@ -0,0 +1,56 @@
+"""add stock movements ledger
+
+Revision ID: 5c2e7a9d41f3
+Revises: b26f6f555bc8
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e7a9d41f3"
+down_revision: Union[str, None] = "b26f6f555bc8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stock_movements",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "item_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("items.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("delta", sa.Numeric(12, 4), nullable=False),
+        sa.Column("quantity_after", sa.Numeric(12, 4), nullable=False),
+        sa.Column("note", sa.Text(), nullable=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_stock_movements_item_id_id",
+        "stock_movements",
+        ["item_id", "id"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_stock_movements_item_id_id", table_name="stock_movements", if_exists=True)
+    op.drop_table("stock_movements", if_exists=True)
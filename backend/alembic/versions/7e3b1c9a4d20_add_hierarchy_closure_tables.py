@@ -0,0 +1,59 @@
+"""add item and container closure tables
+
+Revision ID: 7e3b1c9a4d20
+Revises: 5c2e7a9d41f3
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.models.hierarchy import HIERARCHIES, closure_ddl
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7e3b1c9a4d20"
+down_revision: Union[str, None] = "5c2e7a9d41f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    for table, parent, closure in HIERARCHIES:
+        op.create_table(
+            closure,
+            sa.Column(
+                "ancestor_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey(f"{table}.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column(
+                "descendant_id",
+                postgresql.UUID(as_uuid=True),
+                sa.ForeignKey(f"{table}.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            sa.Column("depth", sa.Integer(), nullable=False),
+            if_not_exists=True,
+        )
+        op.create_index(
+            f"ix_{closure}_descendant",
+            closure,
+            ["descendant_id", "depth"],
+            if_not_exists=True,
+        )
+        for statement in closure_ddl(table, parent, closure):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    for table, _parent, closure in HIERARCHIES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_closure_move ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_closure_insert ON {table}")
+        op.execute(f"DROP FUNCTION IF EXISTS {closure}_move()")
+        op.execute(f"DROP FUNCTION IF EXISTS {closure}_insert()")
+        op.drop_index(f"ix_{closure}_descendant", table_name=closure, if_exists=True)
+        op.drop_table(closure, if_exists=True)
@@ -0,0 +1,60 @@
+"""add items trigram indexes
+
+Revision ID: 844538938151
+Revises: 1dfd419c8c11
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "844538938151"
+down_revision: Union[str, None] = "1dfd419c8c11"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_COLUMNS = ("name", "sku", "barcode", "location_note")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for column in TRGM_COLUMNS:
+            op.create_index(
+                f"ix_items_{column}_trgm",
+                "items",
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.create_index(
+            "ix_items_attributes_trgm",
+            "items",
+            [sa.text("(attributes::text) gin_trgm_ops")],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_items_attributes_trgm",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        for column in reversed(TRGM_COLUMNS):
+            op.drop_index(
+                f"ix_items_{column}_trgm",
+                table_name="items",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,40 @@
+"""add items attributes jsonb_path_ops index
+
+Revision ID: a41d6e2f9b57
+Revises: 7e3b1c9a4d20
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a41d6e2f9b57"
+down_revision: Union[str, None] = "7e3b1c9a4d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_attributes_path",
+            "items",
+            ["attributes"],
+            postgresql_using="gin",
+            postgresql_ops={"attributes": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_items_attributes_path",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
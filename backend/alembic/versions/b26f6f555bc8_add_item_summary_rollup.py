@@ -0,0 +1,101 @@
+"""add item summary rollup
+
+Revision ID: b26f6f555bc8
+Revises: 844538938151
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b26f6f555bc8"
+down_revision: Union[str, None] = "844538938151"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "item_summary",
+        sa.Column("category", sa.String(100), primary_key=True),
+        sa.Column("item_type", sa.String(20), primary_key=True),
+        sa.Column("status", sa.String(20), primary_key=True),
+        sa.Column("item_count", sa.BigInteger(), nullable=False),
+        sa.Column("total_value", sa.Numeric(), nullable=False),
+        if_not_exists=True,
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION item_summary_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE'
+               AND OLD.category = NEW.category
+               AND OLD.item_type = NEW.item_type
+               AND OLD.status = NEW.status THEN
+                IF COALESCE(OLD.unit_price * OLD.quantity, 0)
+                   IS DISTINCT FROM COALESCE(NEW.unit_price * NEW.quantity, 0) THEN
+                    UPDATE item_summary
+                    SET total_value = total_value
+                        + COALESCE(NEW.unit_price * NEW.quantity, 0)
+                        - COALESCE(OLD.unit_price * OLD.quantity, 0)
+                    WHERE category = NEW.category
+                      AND item_type = NEW.item_type
+                      AND status = NEW.status;
+                END IF;
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE item_summary
+                SET item_count = item_count - 1,
+                    total_value = total_value - COALESCE(OLD.unit_price * OLD.quantity, 0)
+                WHERE category = OLD.category
+                  AND item_type = OLD.item_type
+                  AND status = OLD.status;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO item_summary (category, item_type, status, item_count, total_value)
+                VALUES (NEW.category, NEW.item_type, NEW.status, 1,
+                        COALESCE(NEW.unit_price * NEW.quantity, 0))
+                ON CONFLICT (category, item_type, status) DO UPDATE
+                SET item_count = item_summary.item_count + 1,
+                    total_value = item_summary.total_value + EXCLUDED.total_value;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS items_summary_sync ON items")
+    op.execute("""
+        CREATE TRIGGER items_summary_sync
+        AFTER INSERT OR DELETE OR UPDATE OF category, item_type, status, quantity, unit_price
+        ON items
+        FOR EACH ROW EXECUTE FUNCTION item_summary_apply()
+    """)
+    # The backfill counts every item, so deltas already queued by the
+    # statement triggers of a later schema would be counted twice when folded.
+    op.execute("""
+        DO $$ BEGIN
+            IF to_regclass('item_summary_delta') IS NOT NULL THEN
+                DELETE FROM item_summary_delta;
+            END IF;
+        END $$
+    """)
+    op.execute("DELETE FROM item_summary")
+    op.execute("""
+        INSERT INTO item_summary (category, item_type, status, item_count, total_value)
+        SELECT category, item_type, status, count(*), COALESCE(sum(unit_price * quantity), 0)
+        FROM items
+        GROUP BY category, item_type, status
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS items_summary_sync ON items")
+    op.execute("DROP FUNCTION IF EXISTS item_summary_apply()")
+    op.drop_table("item_summary", if_exists=True)
@@ -0,0 +1,54 @@
+"""replace items attributes path index with jsonb_ops
+
+Revision ID: b7c4e9a1d352
+Revises: f5a8c2d71b39
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c4e9a1d352"
+down_revision: Union[str, None] = "f5a8c2d71b39"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_attributes",
+            "items",
+            ["attributes"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_items_attributes_path",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_attributes_path",
+            "items",
+            ["attributes"],
+            postgresql_using="gin",
+            postgresql_ops={"attributes": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_items_attributes",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,31 @@
+"""serialize closure-table moves with advisory locks
+
+Revision ID: c1d7e5a3f802
+Revises: b7c4e9a1d352
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.models.hierarchy import HIERARCHIES, closure_functions
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c1d7e5a3f802"
+down_revision: Union[str, None] = "b7c4e9a1d352"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for table, parent, closure in HIERARCHIES:
+        for statement in closure_functions(table, parent, closure):
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    # The locking functions work unchanged on the previous schema; there is
+    # nothing to restore.
+    pass
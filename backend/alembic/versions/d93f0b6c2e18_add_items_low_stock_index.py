@@ -0,0 +1,40 @@
+"""add items low stock partial index
+
+Revision ID: d93f0b6c2e18
+Revises: a41d6e2f9b57
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d93f0b6c2e18"
+down_revision: Union[str, None] = "a41d6e2f9b57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_items_low_stock",
+            "items",
+            ["name", "id"],
+            postgresql_where=sa.text("quantity < min_stock"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_items_low_stock",
+            table_name="items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
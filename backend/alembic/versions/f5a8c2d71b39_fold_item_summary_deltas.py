@@ -0,0 +1,100 @@
+"""replace item summary row trigger with statement-level deltas
+
+Revision ID: f5a8c2d71b39
+Revises: d93f0b6c2e18
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.models.item_summary import (
+    ITEM_SUMMARY_FOLD_FUNCTION,
+    ITEM_SUMMARY_FUNCTION,
+    ITEM_SUMMARY_TRIGGERS,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f5a8c2d71b39"
+down_revision: Union[str, None] = "d93f0b6c2e18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "item_summary_delta",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("item_type", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("item_count", sa.BigInteger(), nullable=False),
+        sa.Column("total_value", sa.Numeric(), nullable=False),
+        if_not_exists=True,
+    )
+    for statement in (
+        ITEM_SUMMARY_FUNCTION,
+        *ITEM_SUMMARY_TRIGGERS,
+        ITEM_SUMMARY_FOLD_FUNCTION,
+    ):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    op.execute("SELECT item_summary_fold()")
+    op.execute("DROP TRIGGER IF EXISTS items_summary_insert ON items")
+    op.execute("DROP TRIGGER IF EXISTS items_summary_update ON items")
+    op.execute("DROP TRIGGER IF EXISTS items_summary_delete ON items")
+    op.execute("DROP FUNCTION IF EXISTS item_summary_fold()")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION item_summary_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'UPDATE'
+               AND OLD.category = NEW.category
+               AND OLD.item_type = NEW.item_type
+               AND OLD.status = NEW.status THEN
+                IF COALESCE(OLD.unit_price * OLD.quantity, 0)
+                   IS DISTINCT FROM COALESCE(NEW.unit_price * NEW.quantity, 0) THEN
+                    UPDATE item_summary
+                    SET total_value = total_value
+                        + COALESCE(NEW.unit_price * NEW.quantity, 0)
+                        - COALESCE(OLD.unit_price * OLD.quantity, 0)
+                    WHERE category = NEW.category
+                      AND item_type = NEW.item_type
+                      AND status = NEW.status;
+                END IF;
+                RETURN NULL;
+            END IF;
+
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE item_summary
+                SET item_count = item_count - 1,
+                    total_value = total_value - COALESCE(OLD.unit_price * OLD.quantity, 0)
+                WHERE category = OLD.category
+                  AND item_type = OLD.item_type
+                  AND status = OLD.status;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO item_summary (category, item_type, status, item_count, total_value)
+                VALUES (NEW.category, NEW.item_type, NEW.status, 1,
+                        COALESCE(NEW.unit_price * NEW.quantity, 0))
+                ON CONFLICT (category, item_type, status) DO UPDATE
+                SET item_count = item_summary.item_count + 1,
+                    total_value = item_summary.total_value + EXCLUDED.total_value;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER items_summary_sync
+        AFTER INSERT OR DELETE OR UPDATE OF category, item_type, status, quantity, unit_price
+        ON items
+        FOR EACH ROW EXECUTE FUNCTION item_summary_apply()
+    """)
+    op.drop_table("item_summary_delta", if_exists=True)
@@ -1,10 +1,13 @@
+from datetime import datetime
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import user_cache
 from app.core.database import get_db
+from app.core.events import USER_EVICTED, broker
 from app.core.security import decode_access_token
 from app.models.user import User
 
@@ -18,12 +21,65 @@ async def get_current_user(
     user_id = decode_access_token(credentials.credentials)
     if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    user = await db.get(User, UUID(user_id))
+    user = await load_user(db, user_id)
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found or inactive")
     return user
 
 
+async def load_user(db: AsyncSession, user_id: str) -> User | None:
+    async def load() -> dict | None:
+        try:
+            user = await db.get(User, UUID(user_id))
+        except ValueError:
+            return None
+        return _user_snapshot(user) if user else None
+
+    # Unknown or deleted ids are not cached: a user created or restored under
+    # that id is seen at once, and stray tokens cannot fill the cache.
+    snapshot = await user_cache.get_or_set(user_id, load, cache_none=False)
+    return _user_from_snapshot(snapshot) if snapshot else None
+
+
+async def evict_user(user_id: str) -> None:
+    # The local tier lives in every worker, so the eviction is broadcast over
+    # the event channel; without Redis it only reaches this worker.
+    await user_cache.delete(user_id)
+    await broker.publish(USER_EVICTED, {"id": user_id})
+
+
+def _evict_local_user(payload: dict) -> None:
+    user_cache.local.delete(payload["id"])
+
+
+broker.on(USER_EVICTED, _evict_local_user)
+
+
+def _user_snapshot(user: User) -> dict:
+    return {
+        "id": str(user.id),
+        "username": user.username,
+        "email": user.email,
+        "role": user.role,
+        "is_active": user.is_active,
+        "created_at": user.created_at.isoformat(),
+        "updated_at": user.updated_at.isoformat(),
+    }
+
+
+def _user_from_snapshot(snapshot: dict) -> User:
+    # Detached, read-only stand-in for the row; never add it to a session.
+    return User(
+        id=UUID(snapshot["id"]),
+        username=snapshot["username"],
+        email=snapshot["email"],
+        role=snapshot["role"],
+        is_active=snapshot["is_active"],
+        created_at=datetime.fromisoformat(snapshot["created_at"]),
+        updated_at=datetime.fromisoformat(snapshot["updated_at"]),
+    )
+
+
 def require_role(*roles: str):
     async def checker(user: User = Depends(get_current_user)) -> User:
         if user.role not in roles:
@@ -1,12 +1,14 @@
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.v1.deps import get_current_user
-from app.core.database import get_db
+from app.api.v1.deps import evict_user, get_current_user, require_role
+from app.core.database import after_commit, get_db
 from app.core.security import create_access_token, hash_password, verify_password
 from app.models.user import User
-from app.schemas.auth import LoginRequest, TokenResponse, UserCreate, UserResponse
+from app.schemas.auth import LoginRequest, TokenResponse, UserCreate, UserResponse, UserUpdate
 
 router = APIRouter()
 
@@ -22,12 +24,11 @@ async def register(data: UserCreate, db: AsyncSession = Depends(get_db)):
     user = User(
         username=data.username,
         email=data.email,
-        hashed_password=hash_password(data.password),
+        hashed_password=await hash_password(data.password),
         role=data.role,
     )
     db.add(user)
     await db.flush()
-    await db.refresh(user)
     return user
 
 
@@ -35,7 +36,7 @@ async def register(data: UserCreate, db: AsyncSession = Depends(get_db)):
 async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.username == data.username))
     user = result.scalar_one_or_none()
-    if not user or not verify_password(data.password, user.hashed_password):
+    if not user or not await verify_password(data.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     if not user.is_active:
         raise HTTPException(status_code=403, detail="Account disabled")
@@ -46,3 +47,25 @@ async def login(data: LoginRequest, db: AsyncSession = Depends(get_db)):
 @router.get("/me", response_model=UserResponse)
 async def get_me(user: User = Depends(get_current_user)):
     return user
+
+
+@router.patch("/users/{user_id}", response_model=UserResponse)
+async def update_user(
+    user_id: UUID,
+    data: UserUpdate,
+    db: AsyncSession = Depends(get_db),
+    _admin: User = Depends(require_role("admin")),
+):
+    user = await db.get(User, user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    for key, value in data.model_dump(exclude_unset=True).items():
+        if value is not None:
+            setattr(user, key, value)
+    await db.flush()
+
+    async def invalidate() -> None:
+        await evict_user(str(user_id))
+
+    after_commit(db, invalidate)
+    return user
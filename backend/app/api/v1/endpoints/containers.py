@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_user
+from app.core.cache import CONTAINERS_TAG, cache
 from app.core.database import get_db
 from app.models.user import User
 from app.repositories.container_repository import ContainerRepository
@@ -23,8 +24,11 @@ async def list_containers(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    repo = ContainerRepository(db)
-    return await repo.list_all()
+    async def load():
+        containers = await ContainerRepository(db).list_all()
+        return [ContainerResponse.model_validate(c).model_dump(mode="json") for c in containers]
+
+    return await cache.get_or_set("containers:list", load, tags=(CONTAINERS_TAG,))
 
 
 @router.post("", response_model=ContainerResponse, status_code=201)
@@ -33,8 +37,8 @@ async def create_container(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    repo = ContainerRepository(db)
-    return await repo.create(**data.model_dump())
+    svc = InventoryService(db)
+    return await svc.create_container(data)
 
 
 @router.get("/{container_id}", response_model=ContainerDetail)
@@ -57,11 +61,8 @@ async def update_container(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    repo = ContainerRepository(db)
-    container = await repo.get_by_id(container_id)
-    if not container:
-        raise HTTPException(status_code=404, detail="Container not found")
-    return await repo.update(container, **data.model_dump(exclude_unset=True))
+    svc = InventoryService(db)
+    return await svc.update_container(container_id, data.model_dump(exclude_unset=True))
 
 
 @router.delete("/{container_id}", status_code=204)
@@ -0,0 +1,53 @@
+import tempfile
+from pathlib import Path
+
+from fastapi import APIRouter, Depends, HTTPException, Path as PathParam, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.deps import get_current_user
+from app.core.config import settings
+from app.core.database import get_db
+from app.models.user import User
+from app.schemas.imports import ImportReport
+from app.services.import_service import IMPORT_FORMATS, InventoryImporter, import_format
+from app.services.upload_service import discard, receive_file
+
+router = APIRouter()
+
+IMPORT_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+@router.post("/{target}", response_model=ImportReport, openapi_extra=IMPORT_UPLOAD_OPENAPI)
+async def import_inventory(
+    request: Request,
+    target: str = PathParam(..., pattern="^(items|containers)$"),
+    dry_run: bool = False,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    received = await receive_file(
+        request,
+        max_size=settings.IMPORT_MAX_SIZE,
+        allowed_extensions=set(IMPORT_FORMATS),
+        directory=Path(tempfile.gettempdir()),
+    )
+    try:
+        importer = InventoryImporter(db, target=target, dry_run=dry_run)
+        return await importer.run(received.path, import_format(received.filename))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        await discard(received)
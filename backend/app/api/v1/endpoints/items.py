@@ -1,21 +1,32 @@
+from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_user
 from app.core.database import get_db
 from app.models.user import User
-from app.repositories.item_repository import ItemRepository
+from app.repositories.item_repository import ItemRepository, attribute_filter, parse_facets
+from app.repositories.stock_movement_repository import StockMovementRepository
 from app.schemas.item import (
     AdjustPayload,
+    BatchAdjustPayload,
+    BatchAdjustResult,
+    BulkItemCreate,
+    BulkItemResult,
+    BulkItemUpdate,
     ItemCreate,
     ItemResponse,
+    ItemSearchHit,
     ItemUpdate,
     MovePayload,
     PaginatedItems,
     StatusPayload,
+    StockMovementResponse,
 )
+from app.services.export_service import EXPORT_MEDIA_TYPES, make_encoder, stream_export
 from app.services.inventory_service import InventoryService
 
 router = APIRouter()
@@ -29,27 +40,137 @@ async def list_items(
     container_id: UUID | None = None,
     low_stock: bool = False,
     search: str | None = None,
+    attr: list[str] = Query([]),
+    facets: str | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     sort_by: str = "updated_at",
     sort_order: str = "desc",
+    pagination: str = Query("offset", pattern="^(offset|cursor)$"),
+    cursor: str | None = None,
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
     repo = ItemRepository(db)
-    items, total = await repo.list_items(
+    try:
+        facet_names = parse_facets(facets)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if pagination == "cursor" or cursor:
+        try:
+            items, next_cursor, total, facet_counts = await repo.list_items_keyset(
+                item_type=item_type,
+                category=category,
+                status=status,
+                container_id=container_id,
+                low_stock=low_stock,
+                search=search,
+                attrs=attr,
+                facets=facet_names,
+                cursor=cursor,
+                page_size=page_size,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return PaginatedItems(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            next_cursor=next_cursor,
+            total_estimated=total is not None and not facet_names,
+            facets=facet_counts,
+        )
+
+    try:
+        items, total, facet_counts = await repo.list_items(
+            item_type=item_type,
+            category=category,
+            status=status,
+            container_id=container_id,
+            low_stock=low_stock,
+            search=search,
+            attrs=attr,
+            facets=facet_names,
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return PaginatedItems(
+        items=items, total=total, page=page, page_size=page_size, facets=facet_counts
+    )
+
+
+@router.get("/search", response_model=list[ItemSearchHit])
+async def search_items(
+    q: str = Query(..., min_length=1, max_length=200),
+    item_type: str | None = None,
+    category: str | None = None,
+    status: str | None = None,
+    include_details: bool = False,
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    repo = ItemRepository(db)
+    hits = await repo.search_ranked(
+        q,
         item_type=item_type,
         category=category,
         status=status,
-        container_id=container_id,
-        low_stock=low_stock,
-        search=search,
-        page=page,
-        page_size=page_size,
-        sort_by=sort_by,
-        sort_order=sort_order,
+        include_details=include_details,
+        limit=limit,
+    )
+    return [ItemSearchHit(item=item, rank=rank) for item, rank in hits]
+
+
+@router.get("/export")
+async def export_items(
+    request: Request,
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet)$"),
+    item_type: str | None = None,
+    category: str | None = None,
+    status: str | None = None,
+    container_id: UUID | None = None,
+    low_stock: bool = False,
+    search: str | None = None,
+    attr: list[str] = Query([]),
+    _user: User = Depends(get_current_user),
+):
+    try:
+        encoder = make_encoder(format)
+        for spec in attr:
+            attribute_filter(spec)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filters = {
+        "item_type": item_type,
+        "category": category,
+        "status": status,
+        "container_id": container_id,
+        "low_stock": low_stock,
+        "search": search,
+        "attrs": attr,
+    }
+    gzip = encoder.compressible and "gzip" in request.headers.get("accept-encoding", "")
+    headers = {
+        "Content-Disposition": f'attachment; filename="items-{date.today():%Y%m%d}.{format}"',
+        "Vary": "Accept-Encoding",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        stream_export(encoder, filters, gzip=gzip),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers=headers,
     )
-    return PaginatedItems(items=items, total=total, page=page, page_size=page_size)
 
 
 @router.post("", response_model=ItemResponse, status_code=201)
@@ -62,6 +183,39 @@ async def create_item(
     return await svc.create_item(data)
 
 
+@router.post("/bulk", response_model=BulkItemResult)
+async def bulk_create_items(
+    data: BulkItemCreate,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    svc = InventoryService(db)
+    items, errors = await svc.bulk_create_items(data.items, dry_run=data.dry_run)
+    return BulkItemResult(items=items, errors=errors, dry_run=data.dry_run)
+
+
+@router.patch("/bulk", response_model=BulkItemResult)
+async def bulk_update_items(
+    data: BulkItemUpdate,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    svc = InventoryService(db)
+    items, errors = await svc.bulk_update_items(data.items, dry_run=data.dry_run)
+    return BulkItemResult(items=items, errors=errors, dry_run=data.dry_run)
+
+
+@router.post("/bulk/adjust", response_model=BatchAdjustResult)
+async def batch_adjust(
+    payload: BatchAdjustPayload,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    svc = InventoryService(db)
+    items, errors = await svc.batch_adjust(payload.adjustments, user_id=user.id)
+    return BatchAdjustResult(items=items, errors=errors)
+
+
 @router.get("/{item_id}", response_model=ItemResponse)
 async def get_item(
     item_id: UUID,
@@ -71,7 +225,6 @@ async def get_item(
     repo = ItemRepository(db)
     item = await repo.get_by_id(item_id)
     if not item:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Item not found")
     return item
 
@@ -102,10 +255,21 @@ async def adjust_quantity(
     item_id: UUID,
     payload: AdjustPayload,
     db: AsyncSession = Depends(get_db),
-    _user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user),
 ):
     svc = InventoryService(db)
-    return await svc.adjust_quantity(item_id, payload)
+    return await svc.adjust_quantity(item_id, payload, user_id=user.id)
+
+
+@router.get("/{item_id}/movements", response_model=list[StockMovementResponse])
+async def list_movements(
+    item_id: UUID,
+    limit: int = Query(100, ge=1, le=500),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    repo = StockMovementRepository(db)
+    return await repo.list_for_item(item_id, limit=limit)
 
 
 @router.patch("/{item_id}/status", response_model=ItemResponse)
@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_user
+from app.core.cache import ITEMS_TAG, cache
 from app.core.database import get_db
 from app.models.user import User
 from app.repositories.item_repository import ItemRepository
@@ -10,13 +11,19 @@ from app.schemas.item import ItemResponse
 router = APIRouter()
 
 
+def _serialize(items) -> list[dict]:
+    return [ItemResponse.model_validate(i).model_dump(mode="json") for i in items]
+
+
 @router.get("/low-stock", response_model=list[ItemResponse])
 async def low_stock_report(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    repo = ItemRepository(db)
-    return await repo.get_low_stock()
+    async def load():
+        return _serialize(await ItemRepository(db).get_low_stock())
+
+    return await cache.get_or_set("reports:low-stock", load, tags=(ITEMS_TAG,))
 
 
 @router.get("/idle-assets", response_model=list[ItemResponse])
@@ -24,8 +31,10 @@ async def idle_assets_report(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    repo = ItemRepository(db)
-    return await repo.get_by_status("idle")
+    async def load():
+        return _serialize(await ItemRepository(db).get_by_status("idle"))
+
+    return await cache.get_or_set("reports:idle-assets", load, tags=(ITEMS_TAG,))
 
 
 @router.get("/loaned", response_model=list[ItemResponse])
@@ -33,8 +42,10 @@ async def loaned_report(
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    repo = ItemRepository(db)
-    return await repo.get_by_status("loaned")
+    async def load():
+        return _serialize(await ItemRepository(db).get_by_status("loaned"))
+
+    return await cache.get_or_set("reports:loaned", load, tags=(ITEMS_TAG,))
 
 
 @router.get("/summary")
@@ -43,4 +54,18 @@ async def summary_report(
     _user: User = Depends(get_current_user),
 ):
     repo = ItemRepository(db)
-    return await repo.get_summary()
+    return await cache.get_or_set("reports:summary", repo.get_summary, tags=(ITEMS_TAG,))
+
+
+@router.get("/attribute-facets")
+async def attribute_facets_report(
+    category: str | None = None,
+    limit: int = Query(20, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    async def load():
+        return await ItemRepository(db).attribute_facets(category, limit)
+
+    key = f"reports:attribute-facets:{category or '*'}:{limit}"
+    return await cache.get_or_set(key, load, tags=(ITEMS_TAG,))
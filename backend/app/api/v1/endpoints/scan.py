@@ -1,13 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.v1.deps import get_current_user
 from app.core.database import get_db
+from app.models.user import User
 from app.repositories.container_repository import ContainerRepository
-from app.services.qr_service import generate_qr_code
+from app.schemas.container import LabelSheetRequest
+from app.services.qr_service import QR_MEDIA_TYPES, qr_cache_key, render_label_sheet, render_qr
 
 router = APIRouter()
 
+QR_CACHE_CONTROL = "public, max-age=86400"
+
+
+@router.post("/labels")
+async def label_sheet(
+    data: LabelSheetRequest,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    repo = ContainerRepository(db)
+    by_id = {c.id: c for c in await repo.get_many(data.container_ids)}
+    missing = [str(cid) for cid in data.container_ids if cid not in by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Containers not found: {', '.join(missing)}")
+
+    labels = [(by_id[cid].qr_code_id, by_id[cid].name) for cid in data.container_ids]
+    content = await render_label_sheet(labels, columns=data.columns, fmt=data.format)
+    media_type = "application/pdf" if data.format == "pdf" else "image/png"
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'inline; filename="labels.{data.format}"'},
+    )
+
 
 @router.get("/{qr_code_id}")
 async def scan_lookup(qr_code_id: str, db: AsyncSession = Depends(get_db)):
@@ -39,6 +66,23 @@ async def scan_lookup(qr_code_id: str, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/{qr_code_id}/qr-image")
-async def get_qr_image(qr_code_id: str):
-    image_bytes = generate_qr_code(qr_code_id)
-    return Response(content=image_bytes, media_type="image/png")
+async def get_qr_image(
+    qr_code_id: str,
+    request: Request,
+    size: int = Query(10, ge=1, le=40),
+    border: int = Query(4, ge=0, le=16),
+    format: str = Query("png", pattern="^(png|svg)$"),
+    db: AsyncSession = Depends(get_db),
+):
+    etag = f'"{qr_cache_key(qr_code_id, size, border, format)}"'
+    headers = {"ETag": etag, "Cache-Control": QR_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+
+    # Unknown codes still render, as before, but never reach the disk cache.
+    known = await ContainerRepository(db).qr_code_exists(qr_code_id)
+    image_bytes = await render_qr(
+        qr_code_id, box_size=size, border=border, fmt=format, cache=known
+    )
+    return Response(content=image_bytes, media_type=QR_MEDIA_TYPES[format], headers=headers)
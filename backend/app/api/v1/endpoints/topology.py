@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_user
@@ -11,6 +11,38 @@ from app.services.topology_service import TopologyService
 router = APIRouter()
 
 
+@router.get("/containers/{container_id}")
+async def get_container_topology(
+    container_id: UUID,
+    depth: int | None = Query(None, ge=0),
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    svc = TopologyService(db)
+    tree = await svc.get_container_tree(container_id, depth)
+    if not tree:
+        raise HTTPException(status_code=404, detail="Container not found")
+    return tree
+
+
+@router.get("/containers/{container_id}/ancestors")
+async def get_container_ancestors(
+    container_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    return await TopologyService(db).get_container_ancestors(container_id)
+
+
+@router.get("/{item_id}/ancestors")
+async def get_item_ancestors(
+    item_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    _user: User = Depends(get_current_user),
+):
+    return await TopologyService(db).get_item_ancestors(item_id)
+
+
 @router.get("/{item_id}")
 async def get_topology(
     item_id: UUID,
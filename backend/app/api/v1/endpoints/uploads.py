@@ -1,60 +1,90 @@
-import os
 import uuid
-from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.deps import get_current_user
-from app.core.database import get_db
+from app.core.cache import ITEMS_TAG, invalidate_on_commit
+from app.core.config import settings
+from app.core.database import after_commit, after_rollback, get_db
+from app.core.events import ITEM_UPDATED, publish_on_commit
+from app.core.images import variant_url
 from app.models.user import User
 from app.repositories.item_repository import ItemRepository
+from app.schemas.item import ItemResponse
+from app.services.image_service import remove_image, schedule_variants
+from app.services.upload_service import receive_file, store_upload
 
 router = APIRouter()
 
-UPLOAD_DIR = Path("/app/uploads")
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
-MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-
-
-@router.post("/image/{item_id}")
+MAX_FILE_SIZE = settings.MAX_UPLOAD_SIZE
+
+IMAGE_UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                }
+            }
+        },
+    }
+}
+
+
+@router.post("/image/{item_id}", openapi_extra=IMAGE_UPLOAD_OPENAPI)
 async def upload_item_image(
     item_id: uuid.UUID,
-    file: UploadFile,
+    request: Request,
     db: AsyncSession = Depends(get_db),
     _user: User = Depends(get_current_user),
 ):
-    repo = ItemRepository(db)
-    item = await repo.get_by_id(item_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    if not file.content_type or not file.content_type.startswith("image/"):
-        raise HTTPException(status_code=400, detail="File must be an image")
-
-    ext = os.path.splitext(file.filename or "")[1].lower()
-    if ext not in ALLOWED_EXTENSIONS:
-        raise HTTPException(status_code=400, detail=f"Allowed formats: {', '.join(ALLOWED_EXTENSIONS)}")
-
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=400, detail="File too large (max 10MB)")
-
-    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-
-    if item.image_url:
-        old_path = UPLOAD_DIR / os.path.basename(item.image_url)
-        if old_path.exists():
-            old_path.unlink()
-
-    filename = f"{uuid.uuid4().hex}{ext}"
-    filepath = UPLOAD_DIR / filename
-    filepath.write_bytes(content)
-
+    # Never hold a pooled connection while a slow client streams the body: end
+    # any transaction the auth lookup opened and only touch the item afterwards.
+    if db.in_transaction():
+        await db.rollback()
+    received = await receive_file(
+        request,
+        max_size=MAX_FILE_SIZE,
+        allowed_extensions=ALLOWED_EXTENSIONS,
+        content_type_prefix="image/",
+    )
+    filename = f"{uuid.uuid4().hex}{received.extension}"
+    await store_upload(received, filename)
     image_url = f"/uploads/{filename}"
-    await repo.update(item, image_url=image_url)
 
-    return {"image_url": image_url}
+    async def remove_new() -> None:
+        await remove_image(image_url)
+
+    try:
+        repo = ItemRepository(db)
+        item = await repo.get_by_id(item_id)
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+        old_url = item.image_url
+        await repo.update(item, image_url=image_url)
+    except Exception:
+        await remove_new()
+        raise
+    # Covers a failed commit in get_db after the handler has returned.
+    after_rollback(db, remove_new)
+    invalidate_on_commit(db, ITEMS_TAG)
+    publish_on_commit(db, ITEM_UPDATED, ItemResponse.model_validate(item).model_dump(mode="json"))
+
+    async def committed() -> None:
+        schedule_variants(image_url)
+        await remove_image(old_url)
+
+    after_commit(db, committed)
+    return {
+        "image_url": image_url,
+        "thumbnail_url": variant_url(image_url, "thumb"),
+        "medium_url": variant_url(image_url, "md"),
+    }
 
 
 @router.delete("/image/{item_id}")
@@ -69,9 +99,18 @@ async def delete_item_image(
         raise HTTPException(status_code=404, detail="Item not found")
 
     if item.image_url:
-        old_path = UPLOAD_DIR / os.path.basename(item.image_url)
-        if old_path.exists():
-            old_path.unlink()
-        await repo.update(item, image_url=None)
+        old_url = item.image_url
+        # repo.update skips None values, so clear the column directly.
+        item.image_url = None
+        await db.flush()
+        invalidate_on_commit(db, ITEMS_TAG)
+        publish_on_commit(
+            db, ITEM_UPDATED, ItemResponse.model_validate(item).model_dump(mode="json")
+        )
+
+        async def remove_old() -> None:
+            await remove_image(old_url)
+
+        after_commit(db, remove_old)
 
     return {"ok": True}
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+
+from app.api.v1.deps import load_user
+from app.core.config import settings
+from app.core.database import async_session_factory
+from app.core.events import INVENTORY_CHANGED, ITEM_DELETED, ITEM_UPDATED, broker
+from app.core.security import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _coalesce(batch: list[dict]) -> list[dict]:
+    # Item changes collapse; anything else (alerts) is delivered as-is.
+    other = [
+        event
+        for event in batch
+        if event["type"] not in (ITEM_UPDATED, ITEM_DELETED, INVENTORY_CHANGED)
+    ]
+    if len(batch) > settings.WS_COALESCE_THRESHOLD or any(
+        event["type"] == INVENTORY_CHANGED for event in batch
+    ):
+        return [{"type": INVENTORY_CHANGED, "payload": {}}, *other]
+    latest: dict[str, dict] = {}
+    for event in batch:
+        if event["type"] in (ITEM_UPDATED, ITEM_DELETED):
+            latest[event["payload"]["id"]] = event
+    return [*latest.values(), *other]
+
+
+async def _authenticate(token: str | None) -> bool:
+    user_id = decode_access_token(token) if token else None
+    if user_id is None:
+        return False
+    async with async_session_factory() as db:
+        user = await load_user(db, user_id)
+    return bool(user and user.is_active)
+
+
+@router.websocket("/ws")
+async def inventory_events(websocket: WebSocket, token: str | None = Query(None)):
+    if not await _authenticate(token):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+
+    subscription = broker.subscribe()
+    window = settings.WS_COALESCE_WINDOW_MS / 1000
+
+    async def send() -> None:
+        while True:
+            batch = await subscription.next_batch(window, settings.WS_PING_INTERVAL_SECONDS)
+            if not batch:
+                # Keeps idle connections alive through proxy read timeouts.
+                await websocket.send_json({"type": "ping"})
+            for event in _coalesce(batch):
+                await websocket.send_json(event)
+
+    async def receive() -> None:
+        # Clients never send anything meaningful; reading detects disconnects.
+        while True:
+            await websocket.receive_text()
+
+    tasks = [asyncio.create_task(send()), asyncio.create_task(receive())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        broker.unsubscribe(subscription)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    for task in done:
+        error = task.exception()
+        if error and not isinstance(error, (WebSocketDisconnect, RuntimeError)):
+            logger.warning("WebSocket connection ended with an error: %r", error)
@@ -0,0 +1,61 @@
+"""Generate WebP thumbnail/medium variants for images already in UPLOAD_DIR.
+
+Usage: python -m app.commands.backfill_image_variants [--force] [--workers N]
+"""
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError
+
+from app.core.images import is_variant_filename
+from app.services.image_service import generate_variants
+from app.services.upload_service import UPLOAD_DIR
+
+logger = logging.getLogger("backfill_image_variants")
+
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+
+def iter_originals(directory: Path):
+    for path in sorted(directory.iterdir()):
+        if (
+            path.is_file()
+            and not path.name.startswith(".")
+            and path.suffix.lower() in SOURCE_EXTENSIONS
+            and not is_variant_filename(path.name)
+        ):
+            yield path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true", help="regenerate existing variants")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--directory", type=Path, default=UPLOAD_DIR)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    generated = failed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(generate_variants, path, force=args.force): path
+            for path in iter_originals(args.directory)
+        }
+        for future in as_completed(futures):
+            try:
+                written = future.result()
+            except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as e:
+                failed += 1
+                logger.warning("skip %s: %s", futures[future].name, e)
+                continue
+            if written:
+                generated += 1
+                logger.info("%s -> %s", futures[future].name, ", ".join(p.name for p in written))
+
+    logger.info("done: %d images processed, %d failed", generated, failed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Report parent/child cycles in the item and container hierarchies.
+
+Usage: python -m app.commands.find_hierarchy_cycles [--target items|containers|all]
+"""
+import argparse
+import asyncio
+import sys
+from uuid import UUID
+
+from app.core.database import async_session_factory, engine
+from app.repositories.container_repository import ContainerRepository
+from app.repositories.item_repository import ItemRepository
+
+REPOSITORIES = {"items": ItemRepository, "containers": ContainerRepository}
+
+
+def find_cycles(links: list[tuple[UUID, UUID]]) -> list[list[UUID]]:
+    # Each node has at most one parent, so following parent pointers from
+    # every unvisited node finds all cycles in O(n) over a single scan.
+    parents = dict(links)
+    state: dict[UUID, int] = {}  # 1 = on current walk, 2 = finished
+    cycles = []
+    for start in parents:
+        walk = []
+        node = start
+        while node is not None and node not in state:
+            state[node] = 1
+            walk.append(node)
+            node = parents.get(node)
+        if node is not None and state[node] == 1:
+            cycles.append(walk[walk.index(node):])
+        for visited in walk:
+            state[visited] = 2
+    return cycles
+
+
+async def run(targets: list[str]) -> int:
+    found = 0
+    try:
+        async with async_session_factory() as session:
+            for target in targets:
+                repo = REPOSITORIES[target](session)
+                cycles = find_cycles(await repo.parent_links())
+                found += len(cycles)
+                print(f"{target}: {len(cycles)} cycle(s)")
+                for cycle in cycles:
+                    print("  " + " -> ".join(str(node) for node in [*cycle, cycle[0]]))
+    finally:
+        await engine.dispose()
+    return 1 if found else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", choices=(*REPOSITORIES, "all"), default="all")
+    args = parser.parse_args()
+    targets = list(REPOSITORIES) if args.target == "all" else [args.target]
+    sys.exit(asyncio.run(run(targets)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Import items or containers from a CSV or XLSX file.
+
+Usage: python -m app.commands.import_inventory FILE [--target items|containers]
+       [--dry-run] [--chunk-size N]
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from app.core.config import settings
+from app.core.database import async_session_factory, engine
+from app.services.import_service import IMPORT_TARGETS, InventoryImporter, import_format
+
+
+async def run(path: Path, target: str, dry_run: bool, chunk_size: int) -> int:
+    try:
+        async with async_session_factory() as session:
+            importer = InventoryImporter(
+                session, target=target, dry_run=dry_run, chunk_size=chunk_size
+            )
+            report = await importer.run(path, import_format(path.name))
+    finally:
+        await engine.dispose()
+    print(report.model_dump_json(indent=2))
+    return 1 if report.failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--target", choices=IMPORT_TARGETS, default="items")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+    try:
+        code = asyncio.run(run(args.file, args.target, args.dry_run, args.chunk_size))
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
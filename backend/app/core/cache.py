@@ -0,0 +1,306 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError, WatchError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import after_commit
+from app.core.events import CACHE_INVALIDATED, broker
+
+logger = logging.getLogger(__name__)
+
+ITEMS_TAG = "items"
+CONTAINERS_TAG = "containers"
+
+MISSING = object()
+
+
+class LocalCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # key -> (expires_at, value, tags); the tags let removal prune _tags.
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+        self._generations: dict[str, int] = {}
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        expires_at, value, _tags = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        self._remove(key)
+
+    def generations(self, tags: Iterable[str]) -> tuple[int, ...]:
+        return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            for key in tuple(self._tags.get(tag, ())):
+                self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        redis_url: str | None,
+        *,
+        prefix: str,
+        default_ttl: int,
+        local_max_entries: int,
+        enabled: bool = True,
+        two_tier: bool = False,
+        retry_after: float = 30.0,
+    ):
+        self.prefix = prefix
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+        self.two_tier = two_tier
+        self.retry_after = retry_after
+        self.local = LocalCache(local_max_entries)
+        self._redis = (
+            redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            if redis_url
+            else None
+        )
+        self._redis_down_until = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @property
+    def redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}:tag:{tag}"
+
+    def _version_key(self, tag: str) -> str:
+        return f"{self.prefix}:tagver:{tag}"
+
+    def _redis_failed(self, exc: Exception) -> None:
+        self.errors += 1
+        if time.monotonic() >= self._redis_down_until:
+            logger.warning("Redis cache unavailable, using in-process cache: %s", exc)
+        self._redis_down_until = time.monotonic() + self.retry_after
+
+    async def get(self, key: str) -> Any:
+        if self.two_tier:
+            value = self.local.get(key)
+            if value is not MISSING:
+                return value
+        if self.redis_available:
+            try:
+                raw = await self._redis.get(self._key(key))
+            except (RedisError, OSError) as e:
+                self._redis_failed(e)
+            else:
+                if raw is None:
+                    return MISSING
+                value = json.loads(raw)
+                if self.two_tier:
+                    self.local.set(key, value, self.default_ttl)
+                return value
+        return MISSING if self.two_tier else self.local.get(key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        ttl: int | None = None,
+        tags: Iterable[str] = (),
+        versions: list | None = None,
+    ) -> None:
+        # versions are the Redis tag versions read before value was built; if
+        # any has moved since, the tags were invalidated and the write is
+        # dropped so a stale value cannot outlive the invalidation.
+        ttl = ttl or self.default_ttl
+        tags = tuple(tags)
+        if self.two_tier:
+            self.local.set(key, value, ttl, tags)
+        if self.redis_available:
+            try:
+                await self._redis_set(key, value, ttl, tags, versions)
+                return
+            except WatchError:
+                return
+            except (RedisError, OSError) as e:
+                self._redis_failed(e)
+        if not self.two_tier:
+            self.local.set(key, value, ttl, tags)
+
+    async def _redis_set(
+        self, key: str, value: Any, ttl: int, tags: tuple[str, ...], versions: list | None
+    ) -> None:
+        version_keys = [self._version_key(tag) for tag in tags] if versions is not None else []
+        async with self._redis.pipeline(transaction=bool(version_keys)) as pipe:
+            if version_keys:
+                await pipe.watch(*version_keys)
+                if await pipe.mget(version_keys) != versions:
+                    return
+                pipe.multi()
+            pipe.set(self._key(key), json.dumps(value), ex=ttl)
+            for tag in tags:
+                pipe.sadd(self._tag_key(tag), self._key(key))
+                pipe.expire(self._tag_key(tag), ttl * 2)
+            await pipe.execute()
+
+    async def _tag_versions(self, tags: tuple[str, ...]) -> list | None:
+        if not tags or not self.redis_available:
+            return None
+        try:
+            return await self._redis.mget([self._version_key(tag) for tag in tags])
+        except (RedisError, OSError) as e:
+            self._redis_failed(e)
+            return None
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        *,
+        ttl: int | None = None,
+        tags: Iterable[str] = (),
+        cache_none: bool = True,
+    ) -> Any:
+        if not self.enabled:
+            return await factory()
+        value = await self.get(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+        self.misses += 1
+        tags = tuple(tags)
+        generations = self.local.generations(tags)
+        versions = await self._tag_versions(tags)
+        value = await factory()
+        if value is None and not cache_none:
+            return value
+        if self.local.generations(tags) != generations:
+            # Invalidated while the value was being built; serve it, don't keep it.
+            return value
+        await self.set(key, value, ttl=ttl, tags=tags, versions=versions)
+        return value
+
+    async def delete(self, key: str) -> None:
+        self.local.delete(key)
+        if self.redis_available:
+            try:
+                await self._redis.delete(self._key(key))
+            except (RedisError, OSError) as e:
+                self._redis_failed(e)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        self.local.invalidate_tags(tags)
+        if not self.redis_available:
+            return
+        try:
+            for tag in tags:
+                # Bump the version first so in-flight fills for the tag are
+                # refused before their keys are collected and deleted.
+                await self._redis.incr(self._version_key(tag))
+                tag_key = self._tag_key(tag)
+                keys = await self._redis.smembers(tag_key)
+                await self._redis.delete(tag_key, *keys)
+        except (RedisError, OSError) as e:
+            self._redis_failed(e)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis" if self.redis_available else "local",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "errors": self.errors,
+            "local_entries": len(self.local),
+        }
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+cache = ResponseCache(
+    settings.REDIS_URL or None,
+    prefix="cache",
+    default_ttl=settings.CACHE_TTL_SECONDS,
+    local_max_entries=settings.CACHE_LOCAL_MAX_ENTRIES,
+    enabled=settings.CACHE_ENABLED,
+)
+
+user_cache = ResponseCache(
+    settings.REDIS_URL if settings.AUTH_USER_CACHE_REDIS else None,
+    prefix="user",
+    default_ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+    local_max_entries=settings.AUTH_USER_CACHE_SIZE,
+    enabled=settings.AUTH_USER_CACHE_TTL_SECONDS > 0,
+    two_tier=True,
+)
+
+
+async def invalidate_tags(*tags: str) -> None:
+    # Every worker keeps its own local tier, so the invalidation is broadcast
+    # over the event channel; without Redis it only reaches this worker.
+    await cache.invalidate_tags(*tags)
+    await broker.publish(CACHE_INVALIDATED, {"tags": list(tags)})
+
+
+def _invalidate_local_tags(payload: dict) -> None:
+    cache.local.invalidate_tags(payload["tags"])
+
+
+broker.on(CACHE_INVALIDATED, _invalidate_local_tags)
+
+
+def invalidate_on_commit(session: AsyncSession, *tags: str) -> None:
+    pending: set[str] | None = session.info.get("cache_tags")
+    if pending is None:
+        pending = session.info["cache_tags"] = set()
+
+        async def flush() -> None:
+            session.info.pop("cache_tags", None)
+            await invalidate_tags(*pending)
+
+        after_commit(session, flush)
+    pending.update(tags)
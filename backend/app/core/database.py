@@ -1,18 +1,124 @@
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from uuid import uuid4
 
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+
+class PoolStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+        self.connects = 0
+        self.invalidated = 0
+
+    def observe_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    # Checkout time covers queueing for a free slot, opening new connections
+    # and the pre-ping round trip.
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.observe_wait(time.perf_counter() - start)
+
+
+def _connect_args() -> dict:
+    if settings.DB_PGBOUNCER:
+        # Transaction-mode PgBouncer hands each transaction a different server
+        # connection, so named prepared statements cannot be reused or cached.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+
+
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    poolclass=InstrumentedPool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=_connect_args(),
+)
 async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record) -> None:
+    pool_stats.connects += 1
+
+
+@event.listens_for(engine.sync_engine, "invalidate")
+def _on_invalidate(dbapi_connection, connection_record, exception) -> None:
+    pool_stats.invalidated += 1
+
+
+def pool_status() -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "checkouts": pool_stats.checkouts,
+        "wait_seconds_total": pool_stats.wait_seconds,
+        "wait_seconds_max": pool_stats.max_wait_seconds,
+        "timeouts": pool_stats.timeouts,
+        "connects": pool_stats.connects,
+        "invalidated": pool_stats.invalidated,
+    }
+
+
 class Base(DeclarativeBase):
     pass
 
 
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    session.info.setdefault("after_commit", []).append(callback)
+
+
+def after_rollback(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    session.info.setdefault("after_rollback", []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    session.info.pop("after_rollback", None)
+    for callback in session.info.pop("after_commit", []):
+        await callback()
+
+
+async def run_after_rollback(session: AsyncSession) -> None:
+    session.info.pop("after_commit", None)
+    for callback in session.info.pop("after_rollback", []):
+        await callback()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
@@ -20,4 +126,6 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
         except Exception:
             await session.rollback()
+            await run_after_rollback(session)
             raise
+        await run_after_commit(session)
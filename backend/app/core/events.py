@@ -0,0 +1,150 @@
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import after_commit
+
+logger = logging.getLogger(__name__)
+
+ITEM_UPDATED = "item_updated"
+ITEM_DELETED = "item_deleted"
+INVENTORY_CHANGED = "inventory_changed"
+STOCK_ALERT = "stock_alert"
+# Worker-internal: handled by registered callbacks, never sent to clients.
+USER_EVICTED = "user_evicted"
+CACHE_INVALIDATED = "cache_invalidated"
+
+
+class Subscription:
+    # Bounded per-connection buffer. A client that falls behind loses its
+    # backlog and is told to refetch instead of holding memory or slowing
+    # the publisher.
+
+    def __init__(self, max_size: int):
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(max_size)
+
+    def put(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": INVENTORY_CHANGED, "payload": {}})
+
+    async def next_batch(self, window: float, timeout: float | None = None) -> list[dict]:
+        try:
+            batch = [await asyncio.wait_for(self.queue.get(), timeout)]
+        except TimeoutError:
+            return []
+        await asyncio.sleep(window)
+        while not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+
+class EventBroker:
+    # Fans events out to this worker's WebSocket subscribers. With Redis, every
+    # worker publishes to one channel and delivers what it receives back, so
+    # all workers see all events; without it, delivery is local to the worker.
+
+    def __init__(self, redis_url: str | None, channel: str, *, retry_after: float = 5.0):
+        self.channel = channel
+        self.retry_after = retry_after
+        self._redis = redis.from_url(redis_url) if redis_url else None
+        self._subscribers: set[Subscription] = set()
+        self._handlers: dict[str, Callable[[dict], None]] = {}
+        self._listener: asyncio.Task | None = None
+        self._connected = False
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(settings.WS_QUEUE_SIZE)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def on(self, event_type: str, handler: Callable[[dict], None]) -> None:
+        # Routes event_type to handler in every worker instead of to subscribers.
+        self._handlers[event_type] = handler
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _dispatch(self, event: dict) -> None:
+        handler = self._handlers.get(event["type"])
+        if handler is not None:
+            handler(event["payload"])
+            return
+        for subscription in tuple(self._subscribers):
+            subscription.put(event)
+
+    async def publish(self, event_type: str, payload: dict[str, Any] | None = None) -> None:
+        event = {"type": event_type, "payload": payload or {}}
+        if self._connected:
+            try:
+                await self._redis.publish(self.channel, json.dumps(event))
+                return
+            except (RedisError, OSError) as e:
+                logger.warning("Event publish failed, delivering locally: %s", e)
+        self._dispatch(event)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    self._connected = True
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._dispatch(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError, ValueError) as e:
+                if self._connected:
+                    logger.warning("Event channel lost, delivering locally: %s", e)
+            self._connected = False
+            await asyncio.sleep(self.retry_after)
+
+    def start(self) -> None:
+        if self._redis is not None and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._connected = False
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+broker = EventBroker(settings.REDIS_URL or None, settings.EVENTS_CHANNEL)
+
+
+def publish_on_commit(session: AsyncSession, event_type: str, payload: dict | None = None) -> None:
+    pending: list[tuple[str, dict | None]] | None = session.info.get("events")
+    if pending is None:
+        pending = session.info["events"] = []
+
+        async def flush() -> None:
+            events = session.info.pop("events", [])
+            if len(events) > settings.WS_COALESCE_THRESHOLD:
+                events = [(INVENTORY_CHANGED, None)]
+            for kind, data in events:
+                await broker.publish(kind, data)
+
+        after_commit(session, flush)
+    pending.append((event_type, payload))
@@ -0,0 +1,19 @@
+import os
+from pathlib import Path
+
+# Longest edge in pixels for each derived WebP rendition.
+IMAGE_VARIANTS = {"thumb": 256, "md": 1024}
+
+
+def variant_filename(filename: str, variant: str) -> str:
+    return f"{Path(filename).stem}_{variant}.webp"
+
+
+def is_variant_filename(filename: str) -> bool:
+    return any(filename.endswith(f"_{variant}.webp") for variant in IMAGE_VARIANTS)
+
+
+def variant_url(image_url: str | None, variant: str) -> str | None:
+    if not image_url or not image_url.startswith("/uploads/"):
+        return None
+    return f"/uploads/{variant_filename(os.path.basename(image_url), variant)}"
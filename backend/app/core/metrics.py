@@ -0,0 +1,328 @@
+import os
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import cache, user_cache
+from app.core.database import pool_status
+from app.core.events import broker
+
+# Minimal in-process Prometheus registry. Each gunicorn worker keeps its own
+# series and labels them with its pid, so a scrape sees whichever worker
+# answered; aggregate with sum without (worker) on the Prometheus side.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SQL_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+WORKER = str(os.getpid())
+
+
+def _labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    pairs.append(f'worker="{WORKER}"')
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        # Per label set: [per-bucket counts..., +Inf count, sum]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), series):
+                cumulative += count
+                le = f'le="{bound}"'
+                lines.append(
+                    f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {series[-1]}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Gauges:
+    # Values read at scrape time from a callback returning {labels: value}.
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...],
+        collect: Callable[[], dict[tuple[str, ...], float]],
+        kind: str = "gauge",
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.collect = collect
+        self.kind = kind
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in self.collect().items():
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+REGISTRY: list = []
+
+
+def register(metric):
+    REGISTRY.append(metric)
+    return metric
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+http_requests = register(
+    Counter("http_requests_total", "HTTP requests", ("method", "route", "status"))
+)
+http_latency = register(
+    Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+)
+request_sql_statements = register(
+    Histogram(
+        "http_request_db_statements",
+        "SQL statements executed per HTTP request",
+        ("route",),
+        COUNT_BUCKETS,
+    )
+)
+request_sql_seconds = register(
+    Histogram(
+        "http_request_db_seconds",
+        "Time spent in SQL per HTTP request",
+        ("route",),
+        LATENCY_BUCKETS,
+    )
+)
+sql_statements = register(
+    Histogram("db_statement_duration_seconds", "SQL statement latency", (), SQL_BUCKETS)
+)
+
+
+class RequestStats:
+    __slots__ = ("statements", "db_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+_request_stats: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        sql_statements.observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_seconds += elapsed
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _error(context):
+        if context.connection is not None:
+            starts = context.connection.info.get("query_start")
+            if starts:
+                starts.pop()
+
+
+class MetricsMiddleware:
+    # Pure ASGI so streaming responses and WebSockets pass straight through.
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_stats.reset(token)
+            route = scope.get("route")
+            # Route templates, never raw paths, keep label cardinality bounded.
+            path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_requests.inc(method, path, str(status_code))
+            http_latency.observe(elapsed, method, path)
+            request_sql_statements.observe(stats.statements, path)
+            request_sql_seconds.observe(stats.db_seconds, path)
+
+
+def register_runtime_collectors() -> None:
+    caches = {"response": cache, "user": user_cache}
+
+    def pool_stat(key: str) -> Callable[[], dict]:
+        return lambda: {(): pool_status()[key]}
+
+    def cache_stat(key: str) -> Callable[[], dict]:
+        return lambda: {(name,): c.stats()[key] for name, c in caches.items()}
+
+    def pool_connections() -> dict:
+        status = pool_status()
+        return {(state,): status[state] for state in ("checked_out", "idle", "overflow")}
+
+    def cache_requests() -> dict:
+        counts = {}
+        for name, c in caches.items():
+            stats = c.stats()
+            counts[(name, "hit")] = stats["hits"]
+            counts[(name, "miss")] = stats["misses"]
+        return counts
+
+    for metric in (
+        Gauges(
+            "db_pool_connections",
+            "Pooled connections by state",
+            ("state",),
+            pool_connections,
+        ),
+        Gauges(
+            "db_pool_size",
+            "Configured pool size",
+            (),
+            pool_stat("size"),
+        ),
+        Gauges(
+            "db_pool_checkouts_total",
+            "Connection checkouts",
+            (),
+            pool_stat("checkouts"),
+            kind="counter",
+        ),
+        Gauges(
+            "db_pool_checkout_wait_seconds_total",
+            "Time spent waiting for connection checkouts",
+            (),
+            pool_stat("wait_seconds_total"),
+            kind="counter",
+        ),
+        Gauges(
+            "db_pool_checkout_wait_seconds_max",
+            "Longest connection checkout wait",
+            (),
+            pool_stat("wait_seconds_max"),
+        ),
+        Gauges(
+            "db_pool_timeouts_total",
+            "Checkouts that timed out waiting for a connection",
+            (),
+            pool_stat("timeouts"),
+            kind="counter",
+        ),
+        Gauges(
+            "db_pool_connects_total",
+            "Database connections opened",
+            (),
+            pool_stat("connects"),
+            kind="counter",
+        ),
+        Gauges(
+            "db_pool_invalidated_total",
+            "Connections invalidated after errors",
+            (),
+            pool_stat("invalidated"),
+            kind="counter",
+        ),
+        Gauges(
+            "cache_requests_total",
+            "Cache lookups by result",
+            ("cache", "result"),
+            cache_requests,
+            kind="counter",
+        ),
+        Gauges(
+            "cache_errors_total",
+            "Cache backend errors",
+            ("cache",),
+            cache_stat("errors"),
+            kind="counter",
+        ),
+        Gauges(
+            "cache_hit_ratio",
+            "Cache hit ratio",
+            ("cache",),
+            cache_stat("hit_rate"),
+        ),
+        Gauges(
+            "websocket_subscribers",
+            "Open WebSocket subscriptions",
+            (),
+            lambda: {(): broker.subscriber_count},
+        ),
+    ):
+        register(metric)
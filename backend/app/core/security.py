@@ -1,21 +1,29 @@
+import time
 from datetime import datetime, timedelta, timezone
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.cache import MISSING, LocalCache
+from app.core.concurrency import WorkerPool
 from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 ALGORITHM = "HS256"
 
+_decoded_tokens = LocalCache(settings.AUTH_TOKEN_CACHE_SIZE)
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+# bcrypt releases the GIL, so a small thread pool keeps logins off the event loop.
+password_pool = WorkerPool("bcrypt", settings.PASSWORD_HASH_WORKERS)
 
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+async def hash_password(password: str) -> str:
+    return await password_pool.run(pwd_context.hash, password)
+
+
+async def verify_password(plain: str, hashed: str) -> bool:
+    return await password_pool.run(pwd_context.verify, plain, hashed)
 
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
@@ -26,8 +34,15 @@ def create_access_token(subject: str, expires_delta: timedelta | None = None) ->
 
 
 def decode_access_token(token: str) -> str | None:
+    cached = _decoded_tokens.get(token)
+    if cached is not MISSING:
+        return cached
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload.get("sub")
     except JWTError:
         return None
+    subject = payload.get("sub")
+    ttl = int(payload.get("exp", 0) - time.time())
+    if subject and ttl > 0:
+        _decoded_tokens.set(token, subject, ttl)
+    return subject
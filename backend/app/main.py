@@ -1,18 +1,37 @@
+import asyncio
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import select
+from sqlalchemy import select, text
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.api.v1.router import api_router
+from app.api.websocket import router as websocket_router
+from app.core.cache import cache, user_cache
+from app.core.concurrency import shutdown_pools
 from app.core.config import settings
-from app.core.database import async_session_factory, engine, Base
+from app.core.events import broker
+from app.core.metrics import (
+    MetricsMiddleware,
+    instrument_engine,
+    register_runtime_collectors,
+    render_metrics,
+)
+from app.core.database import async_session_factory, engine, Base, pool_status
 from app.core.security import hash_password
 from app.models.user import User
 from app.models.container import Container  # noqa: F401
+from app.models.hierarchy import ContainerClosure, ItemClosure  # noqa: F401
 from app.models.item import Item  # noqa: F401
+from app.models.item_summary import ItemSummary, ItemSummaryDelta  # noqa: F401
+from app.models.stock_movement import StockMovement  # noqa: F401
+from app.services.alert_service import alerts
+from app.services.image_service import finish_builds
+from app.services.summary_service import summary_folder
 
 
 @asynccontextmanager
@@ -26,14 +45,25 @@ async def lifespan(app: FastAPI):
             admin = User(
                 username="admin",
                 email="admin@nexus.local",
-                hashed_password=hash_password("admin123"),
+                hashed_password=await hash_password("admin123"),
                 role="admin",
             )
             session.add(admin)
             await session.commit()
 
+    broker.start()
+    summary_folder.start()
+
     yield
 
+    await summary_folder.stop()
+    await alerts.close()
+    await finish_builds()
+    await broker.stop()
+    await cache.close()
+    await user_cache.close()
+    shutdown_pools()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -51,9 +81,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(MetricsMiddleware)
+instrument_engine(engine)
+register_runtime_collectors()
+
 app.include_router(api_router, prefix="/api/v1")
+app.include_router(websocket_router)
 
-uploads_dir = Path("/app/uploads")
+uploads_dir = Path(settings.UPLOAD_DIR)
 uploads_dir.mkdir(parents=True, exist_ok=True)
 app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
 
@@ -61,3 +96,26 @@ app.mount("/uploads", StaticFiles(directory=str(uploads_dir)), name="uploads")
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
+
+
+@app.get("/health/pool")
+async def pool_health():
+    return pool_status()
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    try:
+        async with asyncio.timeout(settings.READINESS_TIMEOUT_SECONDS):
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    except (SQLAlchemyError, OSError, TimeoutError) as e:
+        return JSONResponse(
+            status_code=503, content={"status": "unavailable", "database": type(e).__name__}
+        )
+    return {"status": "ok", "database": "ok"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
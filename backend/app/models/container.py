@@ -26,12 +26,14 @@ class Container(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+    __mapper_args__ = {"eager_defaults": True}
+
     parent: Mapped["Container | None"] = relationship(
-        "Container", remote_side="Container.id", back_populates="children", lazy="selectin"
+        "Container", remote_side="Container.id", back_populates="children", lazy="raise"
     )
     children: Mapped[list["Container"]] = relationship(
-        "Container", back_populates="parent", lazy="selectin"
+        "Container", back_populates="parent", lazy="raise", passive_deletes=True
     )
     items: Mapped[list["Item"]] = relationship(  # noqa: F821
-        "Item", back_populates="container", lazy="selectin"
+        "Item", back_populates="container", lazy="raise", passive_deletes=True
     )
@@ -0,0 +1,157 @@
+import uuid
+
+from sqlalchemy import DDL, ForeignKey, Index, Integer, event
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.container import Container
+from app.models.item import Item
+
+
+class ItemClosure(Base):
+    __tablename__ = "item_closure"
+
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("items.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("items.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("ix_item_closure_descendant", "descendant_id", "depth"),)
+
+
+class ContainerClosure(Base):
+    __tablename__ = "container_closure"
+
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("containers.id", ondelete="CASCADE"), primary_key=True
+    )
+    descendant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("containers.id", ondelete="CASCADE"), primary_key=True
+    )
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (Index("ix_container_closure_descendant", "descendant_id", "depth"),)
+
+
+# Closure rows hold every (ancestor, descendant, distance) pair, including
+# (id, id, 0), so subtree/ancestor questions are a single indexed lookup.
+# Row triggers keep them in step with whichever code path writes the parent
+# column; deletes are handled by the ON DELETE CASCADE foreign keys.
+# create_all and the Alembic migrations both run these statements; this is
+# the only copy of the DDL.
+def closure_functions(table: str, parent: str, closure: str) -> list[str]:
+    # Moves take an exclusive per-table advisory lock and inserts a shared
+    # one, both before reading the closure rows. Under READ COMMITTED each
+    # statement in the function then sees whatever the lock holder committed,
+    # so two crossing moves (A under B, B under A) cannot both pass the cycle
+    # check, and an insert never copies ancestors from a half-finished move.
+    lock_key = f"hashtext('{closure}')"
+    return [
+        f"""
+CREATE OR REPLACE FUNCTION {closure}_insert() RETURNS trigger AS $$
+BEGIN
+    IF NEW.{parent} IS NOT NULL THEN
+        PERFORM pg_advisory_xact_lock_shared({lock_key});
+    END IF;
+    INSERT INTO {closure} (ancestor_id, descendant_id, depth)
+    SELECT ancestor_id, NEW.id, depth + 1 FROM {closure} WHERE descendant_id = NEW.{parent}
+    UNION ALL
+    SELECT NEW.id, NEW.id, 0;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+        f"""
+CREATE OR REPLACE FUNCTION {closure}_move() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_advisory_xact_lock({lock_key});
+    IF NEW.{parent} IS NOT NULL AND EXISTS (
+        SELECT 1 FROM {closure} WHERE ancestor_id = NEW.id AND descendant_id = NEW.{parent}
+    ) THEN
+        RAISE EXCEPTION 'Moving % under % would create a cycle in {table}', NEW.id, NEW.{parent}
+            USING ERRCODE = 'check_violation';
+    END IF;
+
+    DELETE FROM {closure} AS link
+    USING {closure} AS subtree, {closure} AS above
+    WHERE subtree.ancestor_id = NEW.id
+      AND link.descendant_id = subtree.descendant_id
+      AND above.descendant_id = NEW.id
+      AND above.ancestor_id <> NEW.id
+      AND link.ancestor_id = above.ancestor_id;
+
+    IF NEW.{parent} IS NOT NULL THEN
+        INSERT INTO {closure} (ancestor_id, descendant_id, depth)
+        SELECT above.ancestor_id, subtree.descendant_id, above.depth + subtree.depth + 1
+        FROM {closure} AS above, {closure} AS subtree
+        WHERE above.descendant_id = NEW.{parent}
+          AND subtree.ancestor_id = NEW.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""",
+    ]
+
+
+def closure_ddl(table: str, parent: str, closure: str) -> list[str]:
+    return [
+        *closure_functions(table, parent, closure),
+        f"DROP TRIGGER IF EXISTS {table}_closure_insert ON {table}",
+        f"""
+CREATE TRIGGER {table}_closure_insert
+AFTER INSERT ON {table}
+FOR EACH ROW EXECUTE FUNCTION {closure}_insert()
+""",
+        f"DROP TRIGGER IF EXISTS {table}_closure_move ON {table}",
+        f"""
+CREATE TRIGGER {table}_closure_move
+AFTER UPDATE OF {parent} ON {table}
+FOR EACH ROW
+WHEN (OLD.{parent} IS DISTINCT FROM NEW.{parent})
+EXECUTE FUNCTION {closure}_move()
+""",
+        # Backfill; the path array keeps pre-existing cycles from recursing forever.
+        f"""
+INSERT INTO {closure} (ancestor_id, descendant_id, depth)
+WITH RECURSIVE walk AS (
+    SELECT id AS ancestor_id, id AS descendant_id, 0 AS depth, ARRAY[id] AS path
+    FROM {table}
+    UNION ALL
+    SELECT walk.ancestor_id, child.id, walk.depth + 1, walk.path || child.id
+    FROM walk
+    JOIN {table} AS child ON child.{parent} = walk.descendant_id
+    WHERE NOT child.id = ANY(walk.path)
+)
+SELECT ancestor_id, descendant_id, min(depth) FROM walk GROUP BY ancestor_id, descendant_id
+ON CONFLICT DO NOTHING
+""",
+    ]
+
+
+# (table, parent column, closure table)
+HIERARCHIES = (
+    ("items", "parent_item_id", "item_closure"),
+    ("containers", "parent_container_id", "container_closure"),
+)
+
+ITEM_CLOSURE_DDL = closure_ddl(*HIERARCHIES[0])
+CONTAINER_CLOSURE_DDL = closure_ddl(*HIERARCHIES[1])
+
+for _model, _statements in (
+    (ItemClosure, ITEM_CLOSURE_DDL),
+    (ContainerClosure, CONTAINER_CLOSURE_DDL),
+):
+    for _statement in _statements:
+        event.listen(
+            _model.__table__,
+            "after_create",
+            DDL(_statement).execute_if(dialect="postgresql"),
+        )
+
+ItemClosure.__table__.add_is_dependent_on(Item.__table__)
+ContainerClosure.__table__.add_is_dependent_on(Container.__table__)
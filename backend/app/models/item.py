@@ -3,6 +3,7 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 
 from sqlalchemy import (
+    DDL,
     Date,
     DateTime,
     ForeignKey,
@@ -10,7 +11,9 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    event,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -59,16 +62,65 @@ class Item(Base):
     )
 
     container: Mapped["Container | None"] = relationship(  # noqa: F821
-        "Container", back_populates="items", lazy="selectin"
+        "Container", back_populates="items", lazy="raise"
     )
     parent_item: Mapped["Item | None"] = relationship(
-        "Item", remote_side="Item.id", back_populates="child_items", lazy="selectin"
+        "Item", remote_side="Item.id", back_populates="child_items", lazy="raise"
     )
     child_items: Mapped[list["Item"]] = relationship(
-        "Item", back_populates="parent_item", lazy="selectin"
+        "Item", back_populates="parent_item", lazy="raise", passive_deletes=True
     )
 
+    # Fetch server-generated created_at/updated_at via RETURNING on flush.
+    __mapper_args__ = {"eager_defaults": True}
+
     __table_args__ = (
         Index("ix_items_type_category", "item_type", "category"),
         Index("ix_items_status", "status"),
+        Index("ix_items_updated_at_id", "updated_at", "id"),
+        Index(
+            "ix_items_low_stock",
+            "name",
+            "id",
+            postgresql_where=text("quantity < min_stock"),
+        ),
+        Index(
+            "ix_items_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_items_sku_trgm",
+            "sku",
+            postgresql_using="gin",
+            postgresql_ops={"sku": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_items_barcode_trgm",
+            "barcode",
+            postgresql_using="gin",
+            postgresql_ops={"barcode": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_items_location_note_trgm",
+            "location_note",
+            postgresql_using="gin",
+            postgresql_ops={"location_note": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_items_attributes_trgm",
+            text("(attributes::text) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        # Default jsonb_ops, not jsonb_path_ops: it also indexes keys, so bare
+        # key (?) and jsonpath (@?) attribute filters can use it, not just @>.
+        Index("ix_items_attributes", "attributes", postgresql_using="gin"),
     )
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
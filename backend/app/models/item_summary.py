@@ -0,0 +1,146 @@
+from decimal import Decimal
+
+from sqlalchemy import DDL, BigInteger, Numeric, String, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+from app.models.item import Item
+
+
+class ItemSummary(Base):
+    __tablename__ = "item_summary"
+
+    category: Mapped[str] = mapped_column(String(100), primary_key=True)
+    item_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    item_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    total_value: Mapped[Decimal] = mapped_column(Numeric, nullable=False, default=0)
+
+
+class ItemSummaryDelta(Base):
+    __tablename__ = "item_summary_delta"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    category: Mapped[str] = mapped_column(String(100), nullable=False)
+    item_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    item_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    total_value: Mapped[Decimal] = mapped_column(Numeric, nullable=False)
+
+
+# Statement triggers on items append one aggregated delta per touched
+# (category, item_type, status) to item_summary_delta instead of updating the
+# shared rollup row, so concurrent writers in one category never queue on the
+# same row lock. item_summary_fold() moves the deltas into item_summary in key
+# order; readers add any unfolded deltas on top.
+ITEM_SUMMARY_FUNCTION = """
+CREATE OR REPLACE FUNCTION item_summary_apply() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO item_summary_delta (category, item_type, status, item_count, total_value)
+        SELECT category, item_type, status, count(*), COALESCE(sum(unit_price * quantity), 0)
+        FROM new_rows
+        GROUP BY category, item_type, status;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO item_summary_delta (category, item_type, status, item_count, total_value)
+        SELECT category, item_type, status, -count(*), -COALESCE(sum(unit_price * quantity), 0)
+        FROM old_rows
+        GROUP BY category, item_type, status;
+    ELSE
+        INSERT INTO item_summary_delta (category, item_type, status, item_count, total_value)
+        SELECT category, item_type, status, sum(n), sum(v)
+        FROM (
+            SELECT category, item_type, status, 1 AS n,
+                   COALESCE(unit_price * quantity, 0) AS v
+            FROM new_rows
+            UNION ALL
+            SELECT category, item_type, status, -1, -COALESCE(unit_price * quantity, 0)
+            FROM old_rows
+        ) changes
+        GROUP BY category, item_type, status
+        HAVING sum(n) <> 0 OR sum(v) <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Transition tables need one trigger per event and no UPDATE OF column list.
+ITEM_SUMMARY_TRIGGERS = (
+    "DROP TRIGGER IF EXISTS items_summary_sync ON items",
+    "DROP TRIGGER IF EXISTS items_summary_insert ON items",
+    "DROP TRIGGER IF EXISTS items_summary_update ON items",
+    "DROP TRIGGER IF EXISTS items_summary_delete ON items",
+    """
+CREATE TRIGGER items_summary_insert
+AFTER INSERT ON items REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION item_summary_apply()
+""",
+    """
+CREATE TRIGGER items_summary_update
+AFTER UPDATE ON items REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION item_summary_apply()
+""",
+    """
+CREATE TRIGGER items_summary_delete
+AFTER DELETE ON items REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION item_summary_apply()
+""",
+)
+
+# Single folder at a time (others return 0 instead of waiting); rows are
+# applied in key order. Deltas from transactions still in flight are not
+# visible to the DELETE and are picked up by the next fold.
+ITEM_SUMMARY_FOLD_FUNCTION = """
+CREATE OR REPLACE FUNCTION item_summary_fold() RETURNS integer AS $$
+DECLARE
+    folded integer;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('item_summary_fold')) THEN
+        RETURN 0;
+    END IF;
+    WITH moved AS (
+        DELETE FROM item_summary_delta
+        RETURNING category, item_type, status, item_count, total_value
+    )
+    INSERT INTO item_summary (category, item_type, status, item_count, total_value)
+    SELECT category, item_type, status, sum(item_count), sum(total_value)
+    FROM moved
+    GROUP BY category, item_type, status
+    ORDER BY category, item_type, status
+    ON CONFLICT (category, item_type, status) DO UPDATE
+    SET item_count = item_summary.item_count + EXCLUDED.item_count,
+        total_value = item_summary.total_value + EXCLUDED.total_value;
+    GET DIAGNOSTICS folded = ROW_COUNT;
+    RETURN folded;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# Rebuilds the rollup from items. Pending deltas are already reflected in the
+# items they came from, so they are discarded rather than folded on top.
+ITEM_SUMMARY_BACKFILL = (
+    "DELETE FROM item_summary_delta",
+    "DELETE FROM item_summary",
+    """
+INSERT INTO item_summary (category, item_type, status, item_count, total_value)
+SELECT category, item_type, status, count(*), COALESCE(sum(unit_price * quantity), 0)
+FROM items
+GROUP BY category, item_type, status
+""",
+)
+
+ItemSummary.__table__.add_is_dependent_on(Item.__table__)
+ItemSummaryDelta.__table__.add_is_dependent_on(ItemSummary.__table__)
+
+for _statement in (
+    ITEM_SUMMARY_FUNCTION,
+    *ITEM_SUMMARY_TRIGGERS,
+    ITEM_SUMMARY_FOLD_FUNCTION,
+    *ITEM_SUMMARY_BACKFILL,
+):
+    event.listen(
+        ItemSummaryDelta.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="postgresql"),
+    )
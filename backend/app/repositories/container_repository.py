@@ -1,11 +1,12 @@
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.models.container import Container
+from app.models.hierarchy import ContainerClosure
 from app.models.item import Item
+from app.repositories import loading
 
 
 class ContainerRepository:
@@ -16,9 +17,15 @@ class ContainerRepository:
         container = Container(**kwargs)
         self.db.add(container)
         await self.db.flush()
-        await self.db.refresh(container)
         return container
 
+    async def create_many(self, rows: list[dict]) -> list[Container]:
+        if not rows:
+            return []
+        stmt = insert(Container).returning(Container, sort_by_parameter_order=True)
+        result = await self.db.scalars(stmt, rows)
+        return list(result.all())
+
     async def get_by_id(self, container_id: UUID) -> Container | None:
         return await self.db.get(Container, container_id)
 
@@ -26,13 +33,28 @@ class ContainerRepository:
         q = (
             select(Container)
             .where(Container.id == container_id)
-            .options(selectinload(Container.items), selectinload(Container.children))
+            .options(*loading.CONTAINER_DETAIL)
         )
         result = await self.db.execute(q)
         return result.scalar_one_or_none()
 
+    async def get_many(self, container_ids: list[UUID]) -> list[Container]:
+        q = (
+            select(Container)
+            .options(*loading.CONTAINER_LIST)
+            .where(Container.id.in_(container_ids))
+        )
+        result = await self.db.execute(q)
+        return list(result.scalars().all())
+
+    async def existing_ids(self, container_ids: set[UUID]) -> set[UUID]:
+        if not container_ids:
+            return set()
+        q = select(Container.id).where(Container.id.in_(container_ids))
+        return set((await self.db.execute(q)).scalars().all())
+
     async def list_all(self) -> list[Container]:
-        q = select(Container).order_by(Container.name)
+        q = select(Container).options(*loading.CONTAINER_LIST).order_by(Container.name)
         result = await self.db.execute(q)
         return list(result.scalars().all())
 
@@ -41,7 +63,6 @@ class ContainerRepository:
             if value is not None:
                 setattr(container, key, value)
         await self.db.flush()
-        await self.db.refresh(container)
         return container
 
     async def delete(self, container: Container) -> None:
@@ -62,11 +83,52 @@ class ContainerRepository:
         count = (await self.db.execute(q)).scalar() or 0
         return count > 0
 
+    async def is_descendant(self, container_id: UUID, ancestor_id: UUID) -> bool:
+        q = select(
+            select(ContainerClosure.depth)
+            .where(ContainerClosure.ancestor_id == ancestor_id)
+            .where(ContainerClosure.descendant_id == container_id)
+            .exists()
+        )
+        return bool((await self.db.execute(q)).scalar())
+
+    async def cyclic_moves(self, moves: dict[UUID, UUID]) -> set[UUID]:
+        if not moves:
+            return set()
+        pairs = [(container_id, parent_id) for container_id, parent_id in moves.items()]
+        q = select(ContainerClosure.ancestor_id).where(
+            tuple_(ContainerClosure.ancestor_id, ContainerClosure.descendant_id).in_(pairs)
+        )
+        return set((await self.db.execute(q)).scalars().all())
+
+    async def parent_links(self) -> list[tuple[UUID, UUID]]:
+        q = select(Container.id, Container.parent_container_id).where(
+            Container.parent_container_id.isnot(None)
+        )
+        return [tuple(row) for row in (await self.db.execute(q)).all()]
+
+    async def descendant_count(self, container_id: UUID) -> int:
+        q = (
+            select(func.count())
+            .select_from(ContainerClosure)
+            .where(ContainerClosure.ancestor_id == container_id)
+            .where(ContainerClosure.depth > 0)
+        )
+        return (await self.db.execute(q)).scalar() or 0
+
+    async def qr_code_map(self) -> dict[str, UUID]:
+        result = await self.db.execute(select(Container.qr_code_id, Container.id))
+        return dict(result.all())
+
+    async def qr_code_exists(self, qr_code_id: str) -> bool:
+        q = select(select(Container.id).where(Container.qr_code_id == qr_code_id).exists())
+        return bool((await self.db.execute(q)).scalar())
+
     async def get_by_qr_code(self, qr_code_id: str) -> Container | None:
         q = (
             select(Container)
             .where(Container.qr_code_id == qr_code_id)
-            .options(selectinload(Container.items))
+            .options(*loading.CONTAINER_SCAN)
         )
         result = await self.db.execute(q)
         return result.scalar_one_or_none()
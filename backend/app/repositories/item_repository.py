@@ -1,10 +1,118 @@
+import base64
+import json
+import math
+from collections.abc import AsyncIterator
+from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    Numeric,
+    Text,
+    and_,
+    bindparam,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, JSONPATH, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.hierarchy import ItemClosure
 from app.models.item import Item
+from app.models.item_summary import ItemSummary, ItemSummaryDelta
+from app.repositories import loading
+
+# Non-nullable columns only, so (value, id) row comparisons stay total.
+KEYSET_SORT_COLUMNS = {
+    "updated_at": datetime.fromisoformat,
+    "created_at": datetime.fromisoformat,
+    "name": str,
+    "category": str,
+    "item_type": str,
+    "status": str,
+    "quantity": Decimal,
+}
+
+
+def encode_cursor(sort_by: str, value, item_id: UUID) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([sort_by, str(value), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str) -> tuple[object, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort_by:
+            raise ValueError("Cursor was issued for a different sort order")
+        return KEYSET_SORT_COLUMNS[sort_by](value), UUID(item_id)
+    except (ValueError, TypeError, KeyError, ArithmeticError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+FACET_COLUMNS = {
+    "category": Item.category,
+    "status": Item.status,
+    "item_type": Item.item_type,
+}
+
+ATTRIBUTE_RANGE_OPS = (">=", "<=", ">", "<")
+
+
+def _attribute_value(raw: str):
+    # "24" and "true" match both the JSON scalar and its string spelling.
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return [raw]
+    if isinstance(value, (dict, list)) or value is None:
+        return [raw]
+    return [value] if isinstance(value, str) else [value, raw]
+
+
+def attribute_filter(spec: str):
+    # "key=value", "key>=n" (also <=, >, <) or a bare "key". Every form is an
+    # operator the GIN (jsonb_ops) index supports: equality is containment,
+    # a bare key is ?, and ranges are @? jsonpath predicates. Ranges compare
+    # numerically and skip values that are not numbers; the index narrows
+    # them to rows that have the key, the comparison itself is a recheck.
+    for op in ATTRIBUTE_RANGE_OPS:
+        key, sep, raw = spec.partition(op)
+        if sep and key.strip() and "=" not in key:
+            try:
+                bound = float(raw)
+            except ValueError:
+                bound = math.nan
+            if not math.isfinite(bound):
+                raise ValueError(f"Attribute range on '{key.strip()}' needs a number")
+            quoted = json.dumps(key.strip())
+            path = cast(literal(f"$.{quoted} ? (@.double() {op} {bound!r})"), JSONPATH)
+            return Item.attributes.op("@?")(path)
+    key, sep, raw = spec.partition("=")
+    key = key.strip()
+    if not key:
+        raise ValueError(f"Invalid attribute filter '{spec}'")
+    if not sep:
+        return Item.attributes.has_key(key)
+    return or_(*(Item.attributes.contains({key: v}) for v in _attribute_value(raw.strip())))
+
+
+def parse_facets(facets: str | None) -> list[str]:
+    names = [f.strip() for f in (facets or "").split(",") if f.strip()]
+    unknown = [name for name in names if name not in FACET_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown facet(s): {', '.join(unknown)}")
+    return list(dict.fromkeys(names))
 
 
 class ItemRepository:
@@ -15,11 +123,48 @@ class ItemRepository:
         item = Item(**kwargs)
         self.db.add(item)
         await self.db.flush()
-        await self.db.refresh(item)
         return item
 
+    async def create_many(self, rows: list[dict]) -> list[Item]:
+        if not rows:
+            return []
+        stmt = insert(Item).returning(Item, sort_by_parameter_order=True)
+        result = await self.db.scalars(stmt, rows)
+        return list(result.all())
+
     async def get_by_id(self, item_id: UUID) -> Item | None:
-        return await self.db.get(Item, item_id)
+        return await self.db.get(Item, item_id, options=loading.ITEM_DETAIL)
+
+    async def get_many(self, item_ids: list[UUID]) -> list[Item]:
+        q = (
+            select(Item)
+            .options(*loading.ITEM_LIST)
+            .where(Item.id.in_(item_ids))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(q)
+        return list(result.scalars().all())
+
+    async def existing_ids(self, item_ids: set[UUID]) -> set[UUID]:
+        if not item_ids:
+            return set()
+        result = await self.db.execute(select(Item.id).where(Item.id.in_(item_ids)))
+        return set(result.scalars().all())
+
+    async def ids_by_sku(self, skus: set[str]) -> dict[str, list[UUID]]:
+        if not skus:
+            return {}
+        q = select(Item.sku, Item.id).where(Item.sku.in_(skus))
+        found: dict[str, list[UUID]] = {}
+        for sku, item_id in (await self.db.execute(q)).all():
+            found.setdefault(sku, []).append(item_id)
+        return found
+
+    async def barcode_owners(self, barcodes: set[str]) -> dict[str, UUID]:
+        if not barcodes:
+            return {}
+        q = select(Item.barcode, Item.id).where(Item.barcode.in_(barcodes))
+        return {barcode: item_id for barcode, item_id in (await self.db.execute(q)).all()}
 
     async def list_items(
         self,
@@ -30,23 +175,249 @@ class ItemRepository:
         container_id: UUID | None = None,
         low_stock: bool = False,
         search: str | None = None,
+        attrs: list[str] | None = None,
+        facets: list[str] | None = None,
         page: int = 1,
         page_size: int = 20,
         sort_by: str = "updated_at",
         sort_order: str = "desc",
-    ) -> tuple[list[Item], int]:
-        query = select(Item)
+    ) -> tuple[list[Item], int, dict[str, dict[str, int]] | None]:
+        query = select(Item).options(*loading.ITEM_LIST)
         count_query = select(func.count()).select_from(Item)
 
-        filters = []
+        selected = self._facet_filters(item_type=item_type, category=category, status=status)
+        filters = [
+            *selected.values(),
+            *self._build_filters(
+                container_id=container_id,
+                low_stock=low_stock,
+                search=search,
+                attrs=attrs,
+            ),
+        ]
+        for f in filters:
+            query = query.where(f)
+            count_query = count_query.where(f)
+
+        facet_counts = None
+        if facets:
+            total, facet_counts = await self._facet_counts(filters, facets, selected)
+        else:
+            total = (await self.db.execute(count_query)).scalar() or 0
+
+        sort_col = getattr(Item, sort_by, Item.updated_at)
+        if sort_order == "asc":
+            query = query.order_by(sort_col.asc(), Item.id.asc())
+        else:
+            query = query.order_by(sort_col.desc(), Item.id.desc())
+
+        query = query.offset((page - 1) * page_size).limit(page_size)
+        result = await self.db.execute(query)
+        return list(result.scalars().all()), total, facet_counts
+
+    async def list_items_keyset(
+        self,
+        *,
+        item_type: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+        container_id: UUID | None = None,
+        low_stock: bool = False,
+        search: str | None = None,
+        attrs: list[str] | None = None,
+        facets: list[str] | None = None,
+        cursor: str | None = None,
+        page_size: int = 20,
+        sort_by: str = "updated_at",
+        sort_order: str = "desc",
+    ) -> tuple[list[Item], str | None, int | None, dict[str, dict[str, int]] | None]:
+        if sort_by not in KEYSET_SORT_COLUMNS:
+            raise ValueError(f"Cursor pagination cannot sort by '{sort_by}'")
+
+        selected = self._facet_filters(item_type=item_type, category=category, status=status)
+        filters = [
+            *selected.values(),
+            *self._build_filters(
+                container_id=container_id,
+                low_stock=low_stock,
+                search=search,
+                attrs=attrs,
+            ),
+        ]
+        sort_col = getattr(Item, sort_by)
+        query = select(Item).options(*loading.ITEM_LIST).where(*filters)
+
+        if cursor:
+            value, last_id = decode_cursor(cursor, sort_by)
+            if sort_order == "asc":
+                query = query.where(tuple_(sort_col, Item.id) > tuple_(value, last_id))
+            else:
+                query = query.where(tuple_(sort_col, Item.id) < tuple_(value, last_id))
+
+        if sort_order == "asc":
+            query = query.order_by(sort_col.asc(), Item.id.asc())
+        else:
+            query = query.order_by(sort_col.desc(), Item.id.desc())
+
+        result = await self.db.execute(query.limit(page_size + 1))
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            last = items[-1]
+            next_cursor = encode_cursor(sort_by, getattr(last, sort_by), last.id)
+
+        if facets:
+            total, facet_counts = await self._facet_counts(filters, facets, selected)
+            return items, next_cursor, total, facet_counts
+        total = None if filters else await self.estimate_total()
+        return items, next_cursor, total, None
+
+    async def _facet_counts(
+        self, filters: list, facets: list[str], selected: dict
+    ) -> tuple[int, dict[str, dict[str, int]]]:
+        # GROUPING SETS yields the filtered total and every facet's value
+        # counts from a single scan. Each facet is counted without its own
+        # filter (the scan drops those and FILTER re-applies the others), so
+        # the values not currently selected keep their counts.
+        loose = {name: selected[name] for name in facets if name in selected}
+        where = [f for f in filters if all(f is not c for c in loose.values())]
+
+        def counted(clauses: list):
+            return func.count().filter(and_(*clauses)) if clauses else func.count()
+
+        columns = [FACET_COLUMNS[name] for name in facets]
+        q = (
+            select(
+                *columns,
+                *(func.grouping(c) for c in columns),
+                counted(list(loose.values())),
+                *(counted([c for n, c in loose.items() if n != name]) for name in facets),
+            )
+            .where(*where)
+            .group_by(func.grouping_sets(tuple_(), *columns))
+        )
+        width = len(columns)
+        total = 0
+        counts: dict[str, dict[str, int]] = {name: {} for name in facets}
+        for row in (await self.db.execute(q)).all():
+            values, grouped = row[:width], row[width : 2 * width]
+            if all(grouped):
+                total = row[2 * width]
+            else:
+                index = list(grouped).index(0)
+                count = row[2 * width + 1 + index]
+                if count:
+                    counts[facets[index]][values[index]] = count
+        return total, counts
+
+    async def search_ranked(
+        self,
+        q: str,
+        *,
+        item_type: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+        include_details: bool = False,
+        limit: int = 20,
+    ) -> list[tuple[Item, float]]:
+        fields = [Item.name, Item.sku, Item.barcode]
+        if include_details:
+            fields += [Item.location_note, cast(Item.attributes, Text)]
+
+        term = f"%{q}%"
+        needle = literal(q, Text)
+        match = or_(*(or_(f.ilike(term), needle.op("<%")(f)) for f in fields))
+        rank = func.greatest(
+            *(func.word_similarity(needle, func.coalesce(f, "")) for f in fields)
+        )
+
+        filters = self._build_filters(item_type=item_type, category=category, status=status)
+        query = (
+            select(Item, rank.label("rank"))
+            .options(*loading.ITEM_LIST)
+            .where(match, *filters)
+            .order_by(rank.desc(), Item.name, Item.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return [(item, float(score)) for item, score in result.all()]
+
+    async def stream_rows(
+        self,
+        *,
+        item_type: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+        container_id: UUID | None = None,
+        low_stock: bool = False,
+        search: str | None = None,
+        attrs: list[str] | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict]]:
+        # Plain column rows over a server-side cursor; no ORM identity map.
+        filters = self._build_filters(
+            item_type=item_type,
+            category=category,
+            status=status,
+            container_id=container_id,
+            low_stock=low_stock,
+            search=search,
+            attrs=attrs,
+        )
+        query = (
+            select(*Item.__table__.columns)
+            .where(*filters)
+            .order_by(Item.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(query)
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+
+    async def estimate_total(self) -> int | None:
+        q = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'items'::regclass")
+        estimate = (await self.db.execute(q)).scalar()
+        if estimate is None or estimate < 0:
+            return None
+        return estimate
+
+    @staticmethod
+    def _facet_filters(
+        *,
+        item_type: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+    ) -> dict:
+        # Keyed by facet name so facet counts can drop a dimension's own filter.
+        filters = {}
         if item_type:
-            filters.append(Item.item_type == item_type)
+            filters["item_type"] = Item.item_type == item_type
         if category:
             cats = [c.strip() for c in category.split(",")]
-            filters.append(Item.category.in_(cats))
+            filters["category"] = Item.category.in_(cats)
         if status:
             statuses = [s.strip() for s in status.split(",")]
-            filters.append(Item.status.in_(statuses))
+            filters["status"] = Item.status.in_(statuses)
+        return filters
+
+    @staticmethod
+    def _build_filters(
+        *,
+        item_type: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+        container_id: UUID | None = None,
+        low_stock: bool = False,
+        search: str | None = None,
+        attrs: list[str] | None = None,
+    ) -> list:
+        filters = list(
+            ItemRepository._facet_filters(
+                item_type=item_type, category=category, status=status
+            ).values()
+        )
         if container_id:
             filters.append(Item.container_id == container_id)
         if low_stock:
@@ -61,31 +432,70 @@ class ItemRepository:
                     Item.barcode.ilike(term),
                 )
             )
-
-        for f in filters:
-            query = query.where(f)
-            count_query = count_query.where(f)
-
-        total = (await self.db.execute(count_query)).scalar() or 0
-
-        sort_col = getattr(Item, sort_by, Item.updated_at)
-        if sort_order == "asc":
-            query = query.order_by(sort_col.asc())
-        else:
-            query = query.order_by(sort_col.desc())
-
-        query = query.offset((page - 1) * page_size).limit(page_size)
-        result = await self.db.execute(query)
-        return list(result.scalars().all()), total
+        for spec in attrs or ():
+            filters.append(attribute_filter(spec))
+        return filters
 
     async def update(self, item: Item, **kwargs) -> Item:
         for key, value in kwargs.items():
             if value is not None:
                 setattr(item, key, value)
         await self.db.flush()
-        await self.db.refresh(item)
         return item
 
+    async def apply_delta(self, item_id: UUID, delta: Decimal) -> Item | None:
+        # Single conditional UPDATE so concurrent adjusts serialize on the row
+        # lock instead of overwriting each other; None when the guard fails.
+        stmt = (
+            update(Item)
+            .where(
+                Item.id == item_id,
+                Item.item_type == "consumable",
+                Item.quantity + delta >= 0,
+            )
+            .values(quantity=Item.quantity + delta)
+            .returning(Item)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return (await self.db.scalars(stmt)).one_or_none()
+
+    async def apply_deltas(self, deltas: dict[UUID, Decimal]) -> list[Item]:
+        # One statement for the whole batch: lock the rows in id order, then
+        # apply every delta whose result stays non-negative. Rows that fail the
+        # guard are left as is. Writers that lock items in another order (bulk
+        # update) can still deadlock with this; the service retries those.
+        ids = sorted(deltas)
+        locked = (
+            select(Item.id)
+            .where(Item.id.in_(ids))
+            .order_by(Item.id)
+            .with_for_update()
+            .cte("locked")
+        )
+        changes = func.unnest(
+            bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True))),
+            bindparam("deltas", [deltas[i] for i in ids], type_=ARRAY(Numeric(12, 4))),
+        ).table_valued("item_id", "delta").render_derived(name="changes")
+        stmt = (
+            update(Item)
+            .add_cte(locked)
+            .where(
+                Item.id == changes.c.item_id,
+                Item.id.in_(select(locked.c.id)),
+                Item.item_type == "consumable",
+                Item.quantity + changes.c.delta >= 0,
+            )
+            .values(quantity=Item.quantity + changes.c.delta)
+            .returning(Item)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        return list((await self.db.scalars(stmt)).all())
+
+    async def update_many(self, rows: list[dict]) -> None:
+        # ORM bulk UPDATE by primary key: one executemany per distinct key set.
+        if rows:
+            await self.db.execute(update(Item), rows)
+
     async def delete(self, item: Item) -> None:
         await self.db.delete(item)
         await self.db.flush()
@@ -95,9 +505,43 @@ class ItemRepository:
         count = (await self.db.execute(q)).scalar() or 0
         return count > 0
 
+    async def is_descendant(self, item_id: UUID, ancestor_id: UUID) -> bool:
+        q = select(
+            select(ItemClosure.depth)
+            .where(ItemClosure.ancestor_id == ancestor_id)
+            .where(ItemClosure.descendant_id == item_id)
+            .exists()
+        )
+        return bool((await self.db.execute(q)).scalar())
+
+    async def cyclic_moves(self, moves: dict[UUID, UUID]) -> set[UUID]:
+        # Items whose proposed parent sits inside their own subtree (or is
+        # the item itself), resolved for the whole batch in one lookup.
+        if not moves:
+            return set()
+        pairs = [(item_id, parent_id) for item_id, parent_id in moves.items()]
+        q = select(ItemClosure.ancestor_id).where(
+            tuple_(ItemClosure.ancestor_id, ItemClosure.descendant_id).in_(pairs)
+        )
+        return set((await self.db.execute(q)).scalars().all())
+
+    async def parent_links(self) -> list[tuple[UUID, UUID]]:
+        q = select(Item.id, Item.parent_item_id).where(Item.parent_item_id.isnot(None))
+        return [tuple(row) for row in (await self.db.execute(q)).all()]
+
+    async def descendant_count(self, item_id: UUID) -> int:
+        q = (
+            select(func.count())
+            .select_from(ItemClosure)
+            .where(ItemClosure.ancestor_id == item_id)
+            .where(ItemClosure.depth > 0)
+        )
+        return (await self.db.execute(q)).scalar() or 0
+
     async def get_low_stock(self) -> list[Item]:
         q = (
             select(Item)
+            .options(*loading.ITEM_REPORT)
             .where(Item.item_type == "consumable")
             .where(Item.min_stock.isnot(None))
             .where(Item.quantity < Item.min_stock)
@@ -107,28 +551,116 @@ class ItemRepository:
         return list(result.scalars().all())
 
     async def get_by_status(self, status: str) -> list[Item]:
-        q = select(Item).where(Item.status == status).order_by(Item.name)
+        q = (
+            select(Item)
+            .options(*loading.ITEM_REPORT)
+            .where(Item.status == status)
+            .order_by(Item.name)
+        )
         result = await self.db.execute(q)
         return list(result.scalars().all())
 
-    async def get_summary(self) -> dict:
-        total_q = select(func.count()).select_from(Item)
-        total = (await self.db.execute(total_q)).scalar() or 0
+    async def attribute_facets(self, category: str | None = None, limit: int = 20) -> dict:
+        # One pass over jsonb_each: per category and key, the top `limit`
+        # scalar values with counts, plus the value type and numeric bounds.
+        q = text("""
+            SELECT category, key, value, count, distinct_values, min_type, max_type,
+                   min_number, max_number
+            FROM (
+                SELECT i.category, kv.key, kv.value, count(*) AS count,
+                       row_number() OVER w_ranked AS rank,
+                       count(*) OVER w AS distinct_values,
+                       min(jsonb_typeof(kv.value)) OVER w AS min_type,
+                       max(jsonb_typeof(kv.value)) OVER w AS max_type,
+                       min(CASE WHEN jsonb_typeof(kv.value) = 'number'
+                                THEN (kv.value #>> '{}')::numeric END) OVER w AS min_number,
+                       max(CASE WHEN jsonb_typeof(kv.value) = 'number'
+                                THEN (kv.value #>> '{}')::numeric END) OVER w AS max_number
+                FROM items i
+                CROSS JOIN LATERAL jsonb_each(i.attributes) AS kv(key, value)
+                WHERE jsonb_typeof(kv.value) IN ('string', 'number', 'boolean')
+                  AND (CAST(:category AS text) IS NULL OR i.category = :category)
+                GROUP BY i.category, kv.key, kv.value
+                WINDOW w AS (PARTITION BY i.category, kv.key),
+                       w_ranked AS (w ORDER BY count(*) DESC, kv.value)
+            ) facets
+            WHERE rank <= :limit
+            ORDER BY category, key, rank
+        """).columns(value=JSONB)
+        result = await self.db.execute(q, {"category": category, "limit": limit})
 
-        value_q = select(func.sum(Item.unit_price * Item.quantity)).select_from(Item)
-        total_value = (await self.db.execute(value_q)).scalar() or Decimal("0")
+        facets: dict[str, dict[str, dict]] = {}
+        for row in result.mappings():
+            keys = facets.setdefault(row["category"], {})
+            facet = keys.get(row["key"])
+            if facet is None:
+                value_type = row["min_type"] if row["min_type"] == row["max_type"] else "mixed"
+                facet = keys[row["key"]] = {
+                    "type": value_type,
+                    "distinct_values": row["distinct_values"],
+                    "values": [],
+                }
+                if row["min_number"] is not None:
+                    facet["min"] = float(row["min_number"])
+                    facet["max"] = float(row["max_number"])
+            facet["values"].append({"value": row["value"], "count": row["count"]})
+        return facets
 
-        cat_q = select(Item.category, func.count()).group_by(Item.category)
-        cat_result = await self.db.execute(cat_q)
-        by_category = {row[0]: row[1] for row in cat_result.all()}
+    async def fold_summary(self) -> int:
+        return (await self.db.execute(select(func.item_summary_fold()))).scalar() or 0
 
-        type_q = select(Item.item_type, func.count()).group_by(Item.item_type)
-        type_result = await self.db.execute(type_q)
-        by_type = {row[0]: row[1] for row in type_result.all()}
+    async def get_summary(self) -> dict:
+        keys = ("category", "item_type", "status")
+        rollup = union_all(
+            *(
+                select(*(getattr(t, k) for k in keys), t.item_count, t.total_value)
+                for t in (ItemSummary, ItemSummaryDelta)
+            )
+        ).subquery()
+        per_key = (
+            select(
+                *(rollup.c[k] for k in keys),
+                func.sum(rollup.c.item_count).label("item_count"),
+                func.sum(rollup.c.total_value).label("total_value"),
+            )
+            .group_by(*(rollup.c[k] for k in keys))
+            .having(func.sum(rollup.c.item_count) > 0)
+            .subquery()
+        )
+        q = select(
+            per_key.c.category,
+            per_key.c.item_type,
+            per_key.c.status,
+            func.sum(per_key.c.item_count),
+            func.sum(per_key.c.total_value),
+            func.grouping(per_key.c.category),
+            func.grouping(per_key.c.item_type),
+            func.grouping(per_key.c.status),
+        ).group_by(
+            func.grouping_sets(
+                tuple_(),
+                per_key.c.category,
+                per_key.c.item_type,
+                per_key.c.status,
+            )
+        )
+        result = await self.db.execute(q)
 
-        status_q = select(Item.status, func.count()).group_by(Item.status)
-        status_result = await self.db.execute(status_q)
-        by_status = {row[0]: row[1] for row in status_result.all()}
+        total = 0
+        total_value = Decimal("0")
+        by_category: dict[str, int] = {}
+        by_type: dict[str, int] = {}
+        by_status: dict[str, int] = {}
+        for category, item_type, status, count, value, g_cat, g_type, g_status in result.all():
+            if not g_cat:
+                by_category[category] = int(count)
+            elif not g_type:
+                by_type[item_type] = int(count)
+            elif not g_status:
+                by_status[status] = int(count)
+            else:
+                total = int(count or 0)
+                total_value = value or Decimal("0")
 
         return {
             "total_items": total,
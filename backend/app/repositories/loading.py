@@ -0,0 +1,30 @@
+# Relationships are declared lazy="raise"; each read path opts into exactly
+# the eager loads it serializes.
+
+from sqlalchemy.orm import selectinload
+
+from app.models.container import Container
+from app.models.item import Item
+
+ITEM_BRIEF_COLUMNS = (
+    Item.id,
+    Item.name,
+    Item.item_type,
+    Item.category,
+    Item.quantity,
+    Item.unit,
+    Item.status,
+    Item.min_stock,
+    Item.container_id,
+)
+
+ITEM_LIST: tuple = ()
+ITEM_DETAIL: tuple = ()
+ITEM_REPORT: tuple = ()
+
+CONTAINER_LIST: tuple = ()
+CONTAINER_DETAIL = (
+    selectinload(Container.items).load_only(*ITEM_BRIEF_COLUMNS),
+    selectinload(Container.children),
+)
+CONTAINER_SCAN = (selectinload(Container.items).load_only(*ITEM_BRIEF_COLUMNS),)
@@ -0,0 +1,45 @@
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.stock_movement import StockMovement
+
+
+class StockMovementRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def record(
+        self,
+        item_id: UUID,
+        delta: Decimal,
+        quantity_after: Decimal,
+        *,
+        note: str | None = None,
+        user_id: UUID | None = None,
+    ) -> StockMovement:
+        movement = StockMovement(
+            item_id=item_id,
+            delta=delta,
+            quantity_after=quantity_after,
+            note=note,
+            user_id=user_id,
+        )
+        self.db.add(movement)
+        return movement
+
+    async def record_many(self, rows: list[dict]) -> None:
+        if rows:
+            await self.db.execute(insert(StockMovement), rows)
+
+    async def list_for_item(self, item_id: UUID, *, limit: int = 100) -> list[StockMovement]:
+        q = (
+            select(StockMovement)
+            .where(StockMovement.item_id == item_id)
+            .order_by(StockMovement.id.desc())
+            .limit(limit)
+        )
+        result = await self.db.execute(q)
+        return list(result.scalars().all())
@@ -11,6 +11,11 @@ class UserCreate(BaseModel):
     role: str = Field(default="operator", pattern="^(admin|operator|viewer)$")
 
 
+class UserUpdate(BaseModel):
+    role: str | None = Field(default=None, pattern="^(admin|operator|viewer)$")
+    is_active: bool | None = None
+
+
 class LoginRequest(BaseModel):
     username: str
     password: str
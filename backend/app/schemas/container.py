@@ -49,4 +49,10 @@ class ItemBrief(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class LabelSheetRequest(BaseModel):
+    container_ids: list[UUID] = Field(..., min_length=1, max_length=500)
+    columns: int = Field(default=4, ge=1, le=8)
+    format: str = Field(default="pdf", pattern="^(pdf|png)$")
+
+
 ContainerDetail.model_rebuild()
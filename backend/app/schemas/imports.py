@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    line: int
+    errors: list[str]
+
+
+class ImportReport(BaseModel):
+    target: str
+    dry_run: bool
+    rows: int = 0
+    created: int = 0
+    failed: int = 0
+    chunks: int = 0
+    ignored_columns: list[str] = []
+    errors: list[ImportRowError] = []
+    errors_truncated: bool = False
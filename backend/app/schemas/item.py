@@ -1,8 +1,11 @@
 from datetime import date, datetime
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+from app.core.images import variant_url
 
 
 class ItemCreate(BaseModel):
@@ -71,12 +74,84 @@ class ItemResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
+    @computed_field
+    @property
+    def thumbnail_url(self) -> str | None:
+        return variant_url(self.image_url, "thumb")
+
+    @computed_field
+    @property
+    def medium_url(self) -> str | None:
+        return variant_url(self.image_url, "md")
+
+
+BULK_MAX_ROWS = 1000
+
+
+class BulkItemCreate(BaseModel):
+    # Rows are validated one by one so a bad row is reported, not fatal.
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=BULK_MAX_ROWS)
+    dry_run: bool = False
+
+
+class BulkItemUpdate(BaseModel):
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=BULK_MAX_ROWS)
+    dry_run: bool = False
+
+
+class BulkItemPatch(ItemUpdate):
+    id: UUID
+
+
+class BulkRowError(BaseModel):
+    index: int
+    id: UUID | None = None
+    errors: list[str]
+
+
+class BulkItemResult(BaseModel):
+    items: list[ItemResponse]
+    errors: list[BulkRowError]
+    dry_run: bool = False
+
+
+class ItemSearchHit(BaseModel):
+    item: ItemResponse
+    rank: float
+
 
 class AdjustPayload(BaseModel):
     delta: Decimal
     note: str | None = None
 
 
+class BatchAdjustLine(BaseModel):
+    item_id: UUID
+    delta: Decimal
+    note: str | None = None
+
+
+class BatchAdjustPayload(BaseModel):
+    adjustments: list[BatchAdjustLine] = Field(..., min_length=1, max_length=200)
+
+
+class BatchAdjustResult(BaseModel):
+    items: list[ItemResponse]
+    errors: list[BulkRowError]
+
+
+class StockMovementResponse(BaseModel):
+    id: int
+    item_id: UUID
+    delta: Decimal
+    quantity_after: Decimal
+    note: str | None
+    user_id: UUID | None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
 class StatusPayload(BaseModel):
     status: str = Field(..., pattern="^(in_stock|in_service|idle|loaned|damaged|retired)$")
     assigned_to: str | None = None
@@ -89,6 +164,9 @@ class MovePayload(BaseModel):
 
 class PaginatedItems(BaseModel):
     items: list[ItemResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = None
+    total_estimated: bool = False
+    facets: dict[str, dict[str, int]] | None = None
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import time
+from decimal import Decimal
+
+import httpx
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import after_commit
+from app.core.events import STOCK_ALERT, broker
+from app.models.item import Item
+
+logger = logging.getLogger(__name__)
+
+LOW_STOCK = "low_stock"
+RESTOCKED = "restocked"
+
+
+def is_low_stock(item_type: str, quantity: Decimal, min_stock: Decimal | None) -> bool:
+    return item_type == "consumable" and min_stock is not None and quantity < min_stock
+
+
+def item_is_low(item: Item) -> bool:
+    return is_low_stock(item.item_type, item.quantity, item.min_stock)
+
+
+class LogSink:
+    async def send(self, alert: dict) -> None:
+        logger.warning(
+            "Stock alert %s: %s (%s) quantity %s, min %s",
+            alert["kind"],
+            alert["name"],
+            alert["item_id"],
+            alert["quantity"],
+            alert["min_stock"],
+        )
+
+
+class WebSocketSink:
+    async def send(self, alert: dict) -> None:
+        await broker.publish(STOCK_ALERT, alert)
+
+
+class WebhookSink:
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+
+    async def send(self, alert: dict) -> None:
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(self.url, json=alert)
+            response.raise_for_status()
+
+
+def build_sinks(names: str) -> list:
+    sinks = []
+    for name in (n.strip() for n in names.split(",")):
+        if name == "log":
+            sinks.append(LogSink())
+        elif name == "websocket":
+            sinks.append(WebSocketSink())
+        elif name == "webhook":
+            if settings.ALERT_WEBHOOK_URL:
+                sinks.append(
+                    WebhookSink(settings.ALERT_WEBHOOK_URL, settings.ALERT_WEBHOOK_TIMEOUT_SECONDS)
+                )
+            else:
+                logger.warning("Webhook alert sink enabled without ALERT_WEBHOOK_URL")
+        elif name:
+            logger.warning("Unknown alert sink %r", name)
+    return sinks
+
+
+class AlertDispatcher:
+    # Suppresses repeats of the same (item, kind) until the opposite transition
+    # fires (or dedup_seconds pass), shared across workers through Redis when
+    # it is reachable.
+
+    def __init__(
+        self, sinks: list, *, redis_url: str | None, dedup_seconds: int, retry_after: float = 30.0
+    ):
+        self.sinks = sinks
+        self.dedup_seconds = dedup_seconds
+        self.retry_after = retry_after
+        self._redis = (
+            redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            if redis_url
+            else None
+        )
+        self._redis_down_until = 0.0
+        self._recent: dict[str, float] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def _redis_available(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _redis_failed(self, exc: Exception) -> None:
+        logger.warning("Redis alert dedup unavailable, using in-process: %s", exc)
+        self._redis_down_until = time.monotonic() + self.retry_after
+
+    async def _first_seen(self, key: str) -> bool:
+        if self._redis_available:
+            try:
+                return bool(
+                    await self._redis.set(f"alert:{key}", 1, nx=True, ex=self.dedup_seconds)
+                )
+            except (RedisError, OSError) as e:
+                self._redis_failed(e)
+        now = time.monotonic()
+        self._recent = {k: t for k, t in self._recent.items() if t > now}
+        if key in self._recent:
+            return False
+        self._recent[key] = now + self.dedup_seconds
+        return True
+
+    async def _forget(self, key: str) -> None:
+        self._recent.pop(key, None)
+        if self._redis_available:
+            try:
+                await self._redis.delete(f"alert:{key}")
+            except (RedisError, OSError) as e:
+                self._redis_failed(e)
+
+    async def dispatch(self, alerts: list[dict]) -> None:
+        for alert in alerts:
+            opposite = RESTOCKED if alert["kind"] == LOW_STOCK else LOW_STOCK
+            # A real crossing back re-arms the other alert for this item.
+            await self._forget(f"{alert['item_id']}:{opposite}")
+            if not await self._first_seen(f"{alert['item_id']}:{alert['kind']}"):
+                continue
+            for sink in self.sinks:
+                try:
+                    await sink.send(alert)
+                except Exception:
+                    logger.exception("Alert sink %s failed", type(sink).__name__)
+
+    def submit(self, alerts: list[dict]) -> None:
+        # Webhooks can be slow; never hold up the request that caused the alert.
+        task = asyncio.create_task(self.dispatch(alerts))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=settings.ALERT_WEBHOOK_TIMEOUT_SECONDS)
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+alerts = AlertDispatcher(
+    build_sinks(settings.ALERT_SINKS),
+    redis_url=settings.REDIS_URL or None,
+    dedup_seconds=settings.ALERT_DEDUP_SECONDS,
+)
+
+
+def track_low_stock(session: AsyncSession, item: Item, was_low: bool) -> None:
+    # Fires only when an item crosses its threshold, once the write commits.
+    now_low = item_is_low(item)
+    if now_low == was_low:
+        return
+    pending: list[dict] | None = session.info.get("stock_alerts")
+    if pending is None:
+        pending = session.info["stock_alerts"] = []
+
+        async def flush() -> None:
+            alerts.submit(session.info.pop("stock_alerts", []))
+
+        after_commit(session, flush)
+    pending.append(
+        {
+            "kind": LOW_STOCK if now_low else RESTOCKED,
+            "item_id": str(item.id),
+            "name": item.name,
+            "category": item.category,
+            "quantity": float(item.quantity),
+            "min_stock": float(item.min_stock) if item.min_stock is not None else None,
+            "unit": item.unit,
+        }
+    )
@@ -0,0 +1,190 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.database import async_session_factory
+from app.models.item import Item
+from app.repositories.item_repository import ItemRepository
+
+EXPORT_COLUMNS = [column.name for column in Item.__table__.columns]
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+class CsvEncoder:
+    compressible = True
+
+    def header(self) -> bytes:
+        return self._encode([EXPORT_COLUMNS])
+
+    def encode(self, rows: list[dict]) -> bytes:
+        return self._encode(
+            [
+                [
+                    json.dumps(row[name], default=_json_default, ensure_ascii=False)
+                    if name == "attributes"
+                    else row[name]
+                    for name in EXPORT_COLUMNS
+                ]
+                for row in rows
+            ]
+        )
+
+    def close(self) -> bytes:
+        return b""
+
+    @staticmethod
+    def _encode(rows: list[list]) -> bytes:
+        buf = io.StringIO()
+        csv.writer(buf).writerows(rows)
+        return buf.getvalue().encode()
+
+
+class NdjsonEncoder:
+    compressible = True
+
+    def header(self) -> bytes:
+        return b""
+
+    def encode(self, rows: list[dict]) -> bytes:
+        return "".join(
+            json.dumps(row, default=_json_default, ensure_ascii=False) + "\n" for row in rows
+        ).encode()
+
+    def close(self) -> bytes:
+        return b""
+
+
+class _ChunkSink(io.RawIOBase):
+    # Write-only file that hands bytes back as they are produced; tell() keeps
+    # counting so the Parquet footer offsets stay correct after each drain.
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+class ParquetEncoder:
+    # Parquet pages are already compressed, so no gzip on top.
+    compressible = False
+
+    def __init__(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ValueError("Parquet export requires the pyarrow package") from e
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("item_type", pa.string()),
+                ("name", pa.string()),
+                ("sku", pa.string()),
+                ("category", pa.string()),
+                ("container_id", pa.string()),
+                ("parent_item_id", pa.string()),
+                ("location_note", pa.string()),
+                ("quantity", pa.decimal128(12, 4)),
+                ("unit", pa.string()),
+                ("min_stock", pa.decimal128(12, 4)),
+                ("unit_price", pa.decimal128(12, 2)),
+                ("purchase_date", pa.date32()),
+                ("status", pa.string()),
+                ("assigned_to", pa.string()),
+                ("attributes", pa.string()),
+                ("image_url", pa.string()),
+                ("restock_url", pa.string()),
+                ("barcode", pa.string()),
+                ("created_at", pa.timestamp("us", tz="UTC")),
+                ("updated_at", pa.timestamp("us", tz="UTC")),
+            ]
+        )
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="snappy")
+
+    def header(self) -> bytes:
+        return self._sink.drain()
+
+    def encode(self, rows: list[dict]) -> bytes:
+        for row in rows:
+            for key in ("id", "container_id", "parent_item_id"):
+                if row[key] is not None:
+                    row[key] = str(row[key])
+            row["attributes"] = json.dumps(row["attributes"], ensure_ascii=False)
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        self._writer.write_table(table)
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+EXPORT_ENCODERS = {"csv": CsvEncoder, "ndjson": NdjsonEncoder, "parquet": ParquetEncoder}
+
+
+def make_encoder(fmt: str):
+    return EXPORT_ENCODERS[fmt]()
+
+
+async def stream_export(
+    encoder,
+    filters: dict,
+    *,
+    gzip: bool = False,
+    batch_size: int = settings.EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    # Runs after the response starts, when the request's get_db session has
+    # already been closed, so it holds its own session for the cursor.
+    async with async_session_factory() as session:
+        repo = ItemRepository(session)
+        if chunk := emit(encoder.header()):
+            yield chunk
+        async for rows in repo.stream_rows(**filters, batch_size=batch_size):
+            if chunk := emit(encoder.encode(rows)):
+                yield chunk
+
+    tail = emit(encoder.close())
+    if compressor:
+        tail += compressor.flush()
+    if tail:
+        yield tail
@@ -0,0 +1,90 @@
+import asyncio
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.core.concurrency import WorkerPool
+from app.core.config import settings
+from app.core.images import IMAGE_VARIANTS, variant_filename, variant_url
+from app.services.upload_service import UPLOAD_DIR, remove_upload
+
+logger = logging.getLogger(__name__)
+
+VARIANT_QUALITY = 80
+
+image_pool = WorkerPool("image", settings.IMAGE_VARIANT_WORKERS)
+
+# Variant builds still running, by upload filename, so a removal of the same
+# file can wait for them instead of racing the writes.
+_builds: dict[str, asyncio.Task] = {}
+
+
+def _save_atomic(image: Image.Image, destination: Path) -> None:
+    fd, tmp = tempfile.mkstemp(dir=destination.parent, prefix=".variant-", suffix=".webp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, format="WEBP", quality=VARIANT_QUALITY, method=4)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, destination)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def generate_variants(source: Path, *, force: bool = False) -> list[Path]:
+    targets = {
+        variant: source.with_name(variant_filename(source.name, variant))
+        for variant in IMAGE_VARIANTS
+    }
+    if not force:
+        targets = {variant: path for variant, path in targets.items() if not path.exists()}
+    if not targets:
+        return []
+
+    with Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+
+    written = []
+    for variant, path in targets.items():
+        edge = IMAGE_VARIANTS[variant]
+        rendition = image.copy()
+        rendition.thumbnail((edge, edge), Image.Resampling.LANCZOS)
+        _save_atomic(rendition, path)
+        written.append(path)
+    return written
+
+
+async def build_variants(image_url: str) -> None:
+    source = UPLOAD_DIR / os.path.basename(image_url)
+    try:
+        await image_pool.run(generate_variants, source)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as e:
+        # Clients fall back to image_url when a variant is missing.
+        logger.warning("Could not build variants for %s: %s", source.name, e)
+
+
+def schedule_variants(image_url: str) -> None:
+    # Runs off the request; callers schedule it only once the row is committed.
+    filename = os.path.basename(image_url)
+    task = asyncio.create_task(build_variants(image_url))
+    _builds[filename] = task
+    task.add_done_callback(lambda _: _builds.pop(filename, None))
+
+
+async def finish_builds() -> None:
+    if _builds:
+        await asyncio.wait(tuple(_builds.values()))
+
+
+async def remove_image(image_url: str | None) -> None:
+    if image_url:
+        build = _builds.get(os.path.basename(image_url))
+        if build is not None:
+            await asyncio.wait((build,))
+    await remove_upload(image_url)
+    for variant in IMAGE_VARIANTS:
+        await remove_upload(variant_url(image_url, variant))
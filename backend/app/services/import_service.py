@@ -0,0 +1,316 @@
+import csv
+import json
+import zipfile
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import CONTAINERS_TAG, invalidate_on_commit
+from app.core.config import settings
+from app.core.database import run_after_commit
+from app.core.events import INVENTORY_CHANGED, publish_on_commit
+from app.repositories.container_repository import ContainerRepository
+from app.repositories.item_repository import ItemRepository
+from app.schemas.container import ContainerCreate
+from app.schemas.imports import ImportReport, ImportRowError
+from app.schemas.item import ItemCreate
+from app.services.inventory_service import InventoryService, validation_messages
+
+IMPORT_FORMATS = {".csv": "csv", ".xlsx": "xlsx"}
+IMPORT_TARGETS = ("items", "containers")
+MAX_REPORTED_ERRORS = 1000
+
+ATTRIBUTE_PREFIXES = ("attr.", "attributes.")
+ITEM_COLUMN_ALIASES = {
+    "type": "item_type",
+    "qty": "quantity",
+    "container": "container_qr",
+    "container_qr_code_id": "container_qr",
+    "parent": "parent_sku",
+}
+CONTAINER_COLUMN_ALIASES = {
+    "qr": "qr_code_id",
+    "parent": "parent_qr",
+    "parent_container": "parent_qr",
+    "parent_qr_code_id": "parent_qr",
+}
+ITEM_COLUMNS = set(ItemCreate.model_fields) | {"container_qr", "parent_sku"}
+CONTAINER_COLUMNS = set(ContainerCreate.model_fields) | {"parent_qr"}
+
+# Stand-in id for rows a dry run would have created, so later rows can
+# reference them without anything being written.
+PLANNED = UUID(int=0)
+
+
+def _column_key(header) -> str:
+    return str(header or "").strip().lower().replace(" ", "_")
+
+
+def _cell(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = str(value).strip()
+    return value or None
+
+
+def _iter_csv(path: Path) -> Iterator[tuple[int, list]]:
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        for row in reader:
+            yield reader.line_num, row
+
+
+def _iter_xlsx(path: Path) -> Iterator[tuple[int, tuple]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as e:
+        raise ValueError("XLSX import requires the openpyxl package") from e
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from enumerate(workbook.active.iter_rows(values_only=True), start=1)
+    finally:
+        workbook.close()
+
+
+def iter_records(path: Path, fmt: str) -> Iterator[tuple[int, dict]]:
+    rows = _iter_xlsx(path) if fmt == "xlsx" else _iter_csv(path)
+    header = None
+    for line, row in rows:
+        values = [_cell(v) for v in row]
+        if not any(v is not None for v in values):
+            continue
+        if header is None:
+            header = [_column_key(v) for v in values]
+            continue
+        yield line, {key: value for key, value in zip(header, values) if key}
+
+
+def iter_chunks(records: Iterator, size: int) -> Iterator[list]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _next_chunk(chunks: Iterator[list]) -> list | None:
+    try:
+        return next(chunks, None)
+    except (csv.Error, UnicodeDecodeError, zipfile.BadZipFile, KeyError) as e:
+        raise ValueError(f"Could not read import file: {e}") from e
+
+
+def import_format(filename: str) -> str:
+    fmt = IMPORT_FORMATS.get(Path(filename).suffix.lower())
+    if fmt is None:
+        raise ValueError(f"Allowed formats: {', '.join(sorted(IMPORT_FORMATS))}")
+    return fmt
+
+
+class InventoryImporter:
+    # Reads one chunk at a time off the event loop and writes it with the bulk
+    # paths, so memory is bounded by chunk_size rather than by file size.
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        *,
+        target: str = "items",
+        dry_run: bool = False,
+        chunk_size: int = settings.IMPORT_CHUNK_SIZE,
+    ):
+        if target not in IMPORT_TARGETS:
+            raise ValueError(f"Unknown import target '{target}'")
+        self.db = db
+        self.target = target
+        self.dry_run = dry_run
+        self.chunk_size = chunk_size
+        self.service = InventoryService(db)
+        self.item_repo = ItemRepository(db)
+        self.container_repo = ContainerRepository(db)
+        self.report = ImportReport(target=target, dry_run=dry_run)
+        self._containers: dict[str, UUID] = {}
+        self._skus: dict[str, UUID | None] = {}
+        self._planned_skus: set[str] = set()
+        self._pending: list[tuple[int, dict]] = []
+        self._pending_keys: set[str] = set()
+
+    async def run(self, path: Path, fmt: str) -> ImportReport:
+        self._containers = await self.container_repo.qr_code_map()
+        chunks = iter_chunks(iter_records(path, fmt), self.chunk_size)
+        while (chunk := await run_in_threadpool(_next_chunk, chunks)) is not None:
+            if not self.report.rows:
+                self._note_columns(chunk[0][1])
+            self.report.rows += len(chunk)
+            if self.target == "items":
+                await self._import_items(chunk)
+            else:
+                await self._import_containers(chunk)
+            await self._flush()
+        self.report.errors.sort(key=lambda error: error.line)
+        return self.report
+
+    def _note_columns(self, record: dict) -> None:
+        if self.target == "items":
+            aliases, known = ITEM_COLUMN_ALIASES, ITEM_COLUMNS
+        else:
+            aliases, known = CONTAINER_COLUMN_ALIASES, CONTAINER_COLUMNS
+        self.report.ignored_columns = [
+            key
+            for key in record
+            if aliases.get(key, key) not in known
+            and not (self.target == "items" and key.startswith(ATTRIBUTE_PREFIXES))
+        ]
+
+    def _fail(self, line: int, errors: list[str]) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < MAX_REPORTED_ERRORS:
+            self.report.errors.append(ImportRowError(line=line, errors=errors))
+        else:
+            self.report.errors_truncated = True
+
+    async def _import_items(self, chunk: list[tuple[int, dict]]) -> None:
+        mapped = [(line, *_map_item(record)) for line, record in chunk]
+        # Parent SKU lookups are cached for this chunk only.
+        wanted = {parent for _, _, _, parent, _ in mapped if parent}
+        self._skus = {
+            sku: ids[0] if len(ids) == 1 else None
+            for sku, ids in (await self.item_repo.ids_by_sku(wanted)).items()
+        }
+
+        for line, payload, container_qr, parent_sku, errors in mapped:
+            if container_qr:
+                container_id = self._containers.get(container_qr)
+                if container_id is None:
+                    errors.append(f"container: Unknown container '{container_qr}'")
+                elif container_id != PLANNED:
+                    payload["container_id"] = container_id
+            if parent_sku:
+                if parent_sku in self._pending_keys:
+                    await self._flush()
+                if parent_sku in self._skus:
+                    if self._skus[parent_sku] is None:
+                        errors.append(f"parent_sku: SKU '{parent_sku}' matches several items")
+                    else:
+                        payload["parent_item_id"] = self._skus[parent_sku]
+                elif parent_sku not in self._planned_skus:
+                    errors.append(f"parent_sku: No item with SKU '{parent_sku}'")
+            if errors:
+                self._fail(line, errors)
+                continue
+            self._pending.append((line, payload))
+            if payload.get("sku"):
+                self._pending_keys.add(payload["sku"])
+
+    async def _import_containers(self, chunk: list[tuple[int, dict]]) -> None:
+        for line, record in chunk:
+            payload, parent_qr = _map_container(record)
+            errors = []
+            qr = payload.get("qr_code_id")
+            if qr in self._pending_keys or qr in self._containers:
+                errors.append(f"qr_code_id: Container '{qr}' already exists")
+            if parent_qr:
+                if parent_qr in self._pending_keys:
+                    await self._flush()
+                parent_id = self._containers.get(parent_qr)
+                if parent_id is None:
+                    errors.append(f"parent: Unknown container '{parent_qr}'")
+                elif parent_id != PLANNED:
+                    payload["parent_container_id"] = parent_id
+            try:
+                data = ContainerCreate.model_validate(payload)
+            except ValidationError as e:
+                errors += validation_messages(e)
+            if errors:
+                self._fail(line, errors)
+                continue
+            self._pending.append((line, data.model_dump()))
+            self._pending_keys.add(data.qr_code_id)
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        lines = [line for line, _ in self._pending]
+        rows = [payload for _, payload in self._pending]
+        self._pending, self._pending_keys = [], set()
+
+        if self.target == "items":
+            # One alert (and webhook call) per low row would flood the sinks;
+            # the low-stock report covers what an import brings in.
+            created, errors = await self.service.bulk_create_items(
+                rows, dry_run=self.dry_run, alerts=False
+            )
+            for error in errors:
+                self._fail(lines[error["index"]], error["errors"])
+            failed = {error["index"] for error in errors}
+            for index, row in enumerate(rows):
+                if index not in failed and row.get("sku") and self.dry_run:
+                    self._planned_skus.add(row["sku"])
+            for item in created:
+                if item.sku and item.sku not in self._skus:
+                    self._skus[item.sku] = item.id
+            self.report.created += len(rows) - len(errors)
+        else:
+            if self.dry_run:
+                self._containers.update((row["qr_code_id"], PLANNED) for row in rows)
+            else:
+                created = await self.container_repo.create_many(rows)
+                self._containers.update((c.qr_code_id, c.id) for c in created)
+                invalidate_on_commit(self.db, CONTAINERS_TAG)
+                publish_on_commit(self.db, INVENTORY_CHANGED)
+            self.report.created += len(rows)
+
+        self.report.chunks += 1
+        if not self.dry_run:
+            await self.db.commit()
+            await run_after_commit(self.db)
+            self.db.expunge_all()
+
+
+def _map_item(record: dict) -> tuple[dict, str | None, str | None, list[str]]:
+    payload: dict = {}
+    attributes: dict = {}
+    errors: list[str] = []
+    for key, value in record.items():
+        if value is None:
+            continue
+        if key.startswith(ATTRIBUTE_PREFIXES):
+            attributes[key.split(".", 1)[1]] = value
+            continue
+        key = ITEM_COLUMN_ALIASES.get(key, key)
+        if key == "attributes":
+            try:
+                value = json.loads(value)
+            except (TypeError, ValueError):
+                errors.append("attributes: Invalid JSON")
+                continue
+        if key in ITEM_COLUMNS:
+            payload[key] = value
+    if attributes:
+        if isinstance(payload.get("attributes"), dict):
+            attributes = {**payload["attributes"], **attributes}
+        payload["attributes"] = attributes
+    container_qr = payload.pop("container_qr", None)
+    parent_sku = payload.pop("parent_sku", None)
+    return payload, container_qr, parent_sku, errors
+
+
+def _map_container(record: dict) -> tuple[dict, str | None]:
+    payload = {}
+    for key, value in record.items():
+        key = CONTAINER_COLUMN_ALIASES.get(key, key)
+        if value is not None and key in CONTAINER_COLUMNS:
+            payload[key] = value
+    parent_qr = payload.pop("parent_qr", None)
+    return payload, parent_qr
@@ -1,12 +1,43 @@
+from contextlib import contextmanager
 from decimal import Decimal
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import CONTAINERS_TAG, ITEMS_TAG, invalidate_on_commit
+from app.core.config import settings
+from app.core.database import after_commit
+from app.core.events import (
+    INVENTORY_CHANGED,
+    ITEM_DELETED,
+    ITEM_UPDATED,
+    publish_on_commit,
+)
 from app.repositories.container_repository import ContainerRepository
 from app.repositories.item_repository import ItemRepository
-from app.schemas.item import AdjustPayload, ItemCreate, MovePayload, StatusPayload
+from app.repositories.stock_movement_repository import StockMovementRepository
+from app.schemas.container import ContainerCreate
+from app.schemas.item import (
+    AdjustPayload,
+    BatchAdjustLine,
+    BulkItemPatch,
+    ItemCreate,
+    ItemResponse,
+    MovePayload,
+    StatusPayload,
+)
+from app.services.alert_service import is_low_stock, item_is_low, track_low_stock
+from app.services.image_service import remove_image
+
+# Raised by the closure-table triggers when a re-parent would close a loop.
+CHECK_VIOLATION = "23514"
+DEADLOCK_DETECTED = "40P01"
+BATCH_ADJUST_ATTEMPTS = 3
+ITEM_CYCLE = "Item cannot be moved under itself or one of its descendants."
+CONTAINER_CYCLE = "Container cannot be moved under itself or one of its descendants."
 
 
 class InventoryService:
@@ -14,20 +45,145 @@ class InventoryService:
         self.db = db
         self.item_repo = ItemRepository(db)
         self.container_repo = ContainerRepository(db)
+        self.movement_repo = StockMovementRepository(db)
 
     async def create_item(self, data: ItemCreate):
-        payload = data.model_dump()
-        if payload["item_type"] == "asset":
-            payload["quantity"] = Decimal("1")
-            payload["min_stock"] = None
-        return await self.item_repo.create(**payload)
+        item = await self.item_repo.create(**_new_item_payload(data))
+        track_low_stock(self.db, item, was_low=False)
+        self._items_changed([item])
+        return item
+
+    async def bulk_create_items(
+        self, rows: list[dict], *, dry_run: bool = False, alerts: bool = True
+    ):
+        errors: dict[int, list[str]] = {}
+        payloads: dict[int, dict] = {}
+        for index, row in enumerate(rows):
+            try:
+                payloads[index] = _new_item_payload(ItemCreate.model_validate(row))
+            except ValidationError as e:
+                errors[index] = validation_messages(e)
+
+        await self._check_references(payloads, errors)
+        valid = [payload for index, payload in payloads.items() if index not in errors]
+        items = [] if dry_run else await self.item_repo.create_many(valid)
+        if alerts:
+            for item in items:
+                track_low_stock(self.db, item, was_low=False)
+        self._items_changed(items)
+        return items, _row_errors(errors)
+
+    async def bulk_update_items(self, rows: list[dict], *, dry_run: bool = False):
+        errors: dict[int, list[str]] = {}
+        patches: dict[int, BulkItemPatch] = {}
+        for index, row in enumerate(rows):
+            try:
+                patches[index] = BulkItemPatch.model_validate(row)
+            except ValidationError as e:
+                errors[index] = validation_messages(e)
+
+        ids = [patch.id for patch in patches.values()]
+        if len(ids) != len(set(ids)):
+            seen: set[UUID] = set()
+            for index, patch in patches.items():
+                if patch.id in seen:
+                    errors.setdefault(index, []).append("id: Item appears more than once")
+                seen.add(patch.id)
+
+        existing = {item.id: item for item in await self.item_repo.get_many(ids)} if ids else {}
+        payloads: dict[int, dict] = {}
+        item_ids = {index: patch.id for index, patch in patches.items()}
+        for index, patch in patches.items():
+            item = existing.get(patch.id)
+            if item is None:
+                errors.setdefault(index, []).append("id: Item not found")
+                continue
+            changes = patch.model_dump(exclude_unset=True, exclude={"id"})
+            update_data = {k: v for k, v in changes.items() if v is not None}
+            if item.item_type == "asset" and "quantity" in update_data:
+                update_data["quantity"] = Decimal("1")
+            payloads[index] = update_data
+
+        await self._check_references(payloads, errors, item_ids)
+        moves = {
+            item_ids[index]: payload["parent_item_id"]
+            for index, payload in payloads.items()
+            if payload.get("parent_item_id") and index not in errors
+        }
+        cyclic = await self.item_repo.cyclic_moves(moves)
+        for index, item_id in item_ids.items():
+            if item_id in cyclic:
+                errors.setdefault(index, []).append(f"parent_item_id: {ITEM_CYCLE}")
+        valid = {
+            item_ids[index]: payload
+            for index, payload in payloads.items()
+            if index not in errors and payload
+        }
+        if dry_run or not valid:
+            items = [existing[item_ids[i]] for i in sorted(payloads) if i not in errors]
+            return items, _row_errors(errors, item_ids)
+
+        was_low = {item_id: item_is_low(existing[item_id]) for item_id in valid}
+        with _reject_cycles(ITEM_CYCLE):
+            await self.item_repo.update_many([{"id": k, **v} for k, v in valid.items()])
+        refreshed = {item.id: item for item in await self.item_repo.get_many(list(valid))}
+        for item in refreshed.values():
+            track_low_stock(self.db, item, was_low[item.id])
+        self._items_changed(list(refreshed.values()))
+        items = [
+            refreshed.get(item_ids[i], existing[item_ids[i]])
+            for i in sorted(payloads)
+            if i not in errors
+        ]
+        return items, _row_errors(errors, item_ids)
+
+    async def _check_references(
+        self,
+        payloads: dict[int, dict],
+        errors: dict[int, list[str]],
+        item_ids: dict[int, UUID] | None = None,
+    ) -> None:
+        # One lookup per referenced table for the whole batch.
+        item_ids = item_ids or {}
+        containers = {p["container_id"] for p in payloads.values() if p.get("container_id")}
+        parents = {p["parent_item_id"] for p in payloads.values() if p.get("parent_item_id")}
+        barcodes = {p["barcode"] for p in payloads.values() if p.get("barcode")}
+        found_containers = await self.container_repo.existing_ids(containers)
+        found_parents = await self.item_repo.existing_ids(parents)
+        barcode_owners = await self.item_repo.barcode_owners(barcodes)
+
+        claimed: dict[str, int] = {}
+        for index, payload in payloads.items():
+            row_errors = []
+            if payload.get("container_id") and payload["container_id"] not in found_containers:
+                row_errors.append("container_id: Container not found")
+            if payload.get("parent_item_id") and payload["parent_item_id"] not in found_parents:
+                row_errors.append("parent_item_id: Parent item not found")
+            barcode = payload.get("barcode")
+            if barcode:
+                owner = barcode_owners.get(barcode)
+                if owner is not None and owner != item_ids.get(index):
+                    row_errors.append("barcode: Barcode already in use")
+                elif barcode in claimed:
+                    row_errors.append(f"barcode: Duplicate of row {claimed[barcode]}")
+                else:
+                    claimed[barcode] = index
+            if row_errors:
+                errors.setdefault(index, []).extend(row_errors)
 
     async def update_item(self, item_id: UUID, data: dict):
         item = await self._get_item_or_404(item_id)
         update_data = {k: v for k, v in data.items() if v is not None}
         if item.item_type == "asset" and "quantity" in update_data:
             update_data["quantity"] = Decimal("1")
-        return await self.item_repo.update(item, **update_data)
+        if "parent_item_id" in update_data:
+            await self._check_item_parent(item_id, update_data["parent_item_id"])
+        was_low = item_is_low(item)
+        with _reject_cycles(ITEM_CYCLE):
+            item = await self.item_repo.update(item, **update_data)
+        track_low_stock(self.db, item, was_low)
+        self._items_changed([item])
+        return item
 
     async def delete_item(self, item_id: UUID):
         item = await self._get_item_or_404(item_id)
@@ -36,22 +192,97 @@ class InventoryService:
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Cannot delete item with child dependencies. Remove children first.",
             )
+        image_url = item.image_url
         await self.item_repo.delete(item)
+        invalidate_on_commit(self.db, ITEMS_TAG)
+        publish_on_commit(self.db, ITEM_DELETED, {"id": str(item_id)})
 
-    async def adjust_quantity(self, item_id: UUID, payload: AdjustPayload):
-        item = await self._get_item_or_404(item_id)
-        if item.item_type == "asset":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot adjust quantity for asset type items.",
-            )
-        new_qty = item.quantity + payload.delta
-        if new_qty < 0:
+        async def remove_files() -> None:
+            await remove_image(image_url)
+
+        after_commit(self.db, remove_files)
+
+    async def adjust_quantity(
+        self, item_id: UUID, payload: AdjustPayload, user_id: UUID | None = None
+    ):
+        item = await self.item_repo.apply_delta(item_id, payload.delta)
+        if item is None:
+            item = await self._get_item_or_404(item_id)
+            if item.item_type == "asset":
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cannot adjust quantity for asset type items.",
+                )
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Insufficient stock. Current: {item.quantity}, delta: {payload.delta}",
             )
-        return await self.item_repo.update(item, quantity=new_qty)
+        self.movement_repo.record(
+            item.id, payload.delta, item.quantity, note=payload.note, user_id=user_id
+        )
+        was_low = is_low_stock(item.item_type, item.quantity - payload.delta, item.min_stock)
+        track_low_stock(self.db, item, was_low)
+        self._items_changed([item])
+        return item
+
+    async def batch_adjust(
+        self, lines: list[BatchAdjustLine], user_id: UUID | None = None
+    ):
+        totals: dict[UUID, Decimal] = {}
+        for line in lines:
+            totals[line.item_id] = totals.get(line.item_id, Decimal("0")) + line.delta
+
+        updated = {item.id: item for item in await self._apply_deltas(totals)}
+        rejected = [item_id for item_id in totals if item_id not in updated]
+        current = {}
+        if rejected:
+            current = {item.id: item for item in await self.item_repo.get_many(rejected)}
+
+        errors = []
+        movements = []
+        remaining = dict(totals)
+        for index, line in enumerate(lines):
+            item = updated.get(line.item_id)
+            if item is None:
+                reason = _adjust_rejection(current.get(line.item_id), totals[line.item_id])
+                errors.append({"index": index, "id": line.item_id, "errors": [reason]})
+                continue
+            # Lines for the same item are applied as one delta; replay them in
+            # request order so each ledger row carries its own running balance.
+            remaining[line.item_id] -= line.delta
+            movements.append(
+                {
+                    "item_id": line.item_id,
+                    "delta": line.delta,
+                    "quantity_after": item.quantity - remaining[line.item_id],
+                    "note": line.note,
+                    "user_id": user_id,
+                }
+            )
+
+        await self.movement_repo.record_many(movements)
+        items = [updated[item_id] for item_id in totals if item_id in updated]
+        for item in items:
+            was_low = is_low_stock(item.item_type, item.quantity - totals[item.id], item.min_stock)
+            track_low_stock(self.db, item, was_low)
+        self._items_changed(items)
+        return items, errors
+
+    async def _apply_deltas(self, totals: dict[UUID, Decimal]):
+        # Deadlock victims are rolled back to the savepoint and retried; the
+        # batch's locks are the only ones held at that point.
+        for attempt in range(1, BATCH_ADJUST_ATTEMPTS + 1):
+            try:
+                async with self.db.begin_nested():
+                    return await self.item_repo.apply_deltas(totals)
+            except DBAPIError as e:
+                if getattr(e.orig, "sqlstate", None) != DEADLOCK_DETECTED:
+                    raise
+                if attempt == BATCH_ADJUST_ATTEMPTS:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Items are being updated concurrently, please retry.",
+                    ) from e
 
     async def change_status(self, item_id: UUID, payload: StatusPayload):
         item = await self._get_item_or_404(item_id)
@@ -60,9 +291,11 @@ class InventoryService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="assigned_to is required when status is 'loaned'.",
             )
-        return await self.item_repo.update(
+        item = await self.item_repo.update(
             item, status=payload.status, assigned_to=payload.assigned_to
         )
+        self._items_changed([item])
+        return item
 
     async def move_item(self, item_id: UUID, payload: MovePayload):
         item = await self._get_item_or_404(item_id)
@@ -79,13 +312,41 @@ class InventoryService:
             parent = await self.item_repo.get_by_id(payload.parent_item_id)
             if not parent:
                 raise HTTPException(status_code=404, detail="Target parent item not found.")
-            if payload.parent_item_id == item_id:
-                raise HTTPException(status_code=400, detail="Item cannot be its own parent.")
+            await self._check_item_parent(item_id, payload.parent_item_id)
             update_data["parent_item_id"] = payload.parent_item_id
         else:
             update_data["parent_item_id"] = None
 
-        return await self.item_repo.update(item, **update_data)
+        with _reject_cycles(ITEM_CYCLE):
+            item = await self.item_repo.update(item, **update_data)
+        self._items_changed([item])
+        return item
+
+    async def _check_item_parent(self, item_id: UUID, parent_id: UUID | None) -> None:
+        # The closure table holds (id, id, 0), so self-parenting is caught too.
+        if parent_id is not None and await self.item_repo.is_descendant(parent_id, item_id):
+            raise HTTPException(status_code=400, detail=ITEM_CYCLE)
+
+    async def create_container(self, data: ContainerCreate):
+        container = await self.container_repo.create(**data.model_dump())
+        invalidate_on_commit(self.db, CONTAINERS_TAG)
+        publish_on_commit(self.db, INVENTORY_CHANGED)
+        return container
+
+    async def update_container(self, container_id: UUID, data: dict):
+        container = await self.container_repo.get_by_id(container_id)
+        if not container:
+            raise HTTPException(status_code=404, detail="Container not found.")
+        parent_id = data.get("parent_container_id")
+        if parent_id is not None and await self.container_repo.is_descendant(
+            parent_id, container_id
+        ):
+            raise HTTPException(status_code=400, detail=CONTAINER_CYCLE)
+        with _reject_cycles(CONTAINER_CYCLE):
+            container = await self.container_repo.update(container, **data)
+        invalidate_on_commit(self.db, CONTAINERS_TAG)
+        publish_on_commit(self.db, INVENTORY_CHANGED)
+        return container
 
     async def delete_container(self, container_id: UUID):
         container = await self.container_repo.get_by_id(container_id)
@@ -102,9 +363,66 @@ class InventoryService:
                 detail="Cannot delete container with child containers.",
             )
         await self.container_repo.delete(container)
+        invalidate_on_commit(self.db, CONTAINERS_TAG)
+        publish_on_commit(self.db, INVENTORY_CHANGED)
+
+    def _items_changed(self, items: list) -> None:
+        if not items:
+            return
+        invalidate_on_commit(self.db, ITEMS_TAG)
+        if len(items) > settings.WS_COALESCE_THRESHOLD:
+            publish_on_commit(self.db, INVENTORY_CHANGED)
+            return
+        for item in items:
+            payload = ItemResponse.model_validate(item).model_dump(mode="json")
+            publish_on_commit(self.db, ITEM_UPDATED, payload)
 
     async def _get_item_or_404(self, item_id: UUID):
         item = await self.item_repo.get_by_id(item_id)
         if not item:
             raise HTTPException(status_code=404, detail="Item not found.")
         return item
+
+
+@contextmanager
+def _reject_cycles(detail: str):
+    # The trigger still catches loops formed within one batch, e.g. A->B and B->A.
+    try:
+        yield
+    except IntegrityError as e:
+        if getattr(e.orig, "sqlstate", None) == CHECK_VIOLATION:
+            raise HTTPException(status_code=400, detail=detail) from e
+        raise
+
+
+def _new_item_payload(data: ItemCreate) -> dict:
+    payload = data.model_dump()
+    if payload["item_type"] == "asset":
+        payload["quantity"] = Decimal("1")
+        payload["min_stock"] = None
+    return payload
+
+
+def validation_messages(exc: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}"
+        for err in exc.errors()
+    ]
+
+
+def _adjust_rejection(item, delta: Decimal) -> str:
+    if item is None:
+        return "Item not found."
+    if item.item_type == "asset":
+        return "Cannot adjust quantity for asset type items."
+    return f"Insufficient stock. Current: {item.quantity}, delta: {delta}"
+
+
+def _row_errors(
+    errors: dict[int, list[str]], item_ids: dict[int, UUID] | None = None
+) -> list[dict]:
+    item_ids = item_ids or {}
+    return [
+        {"index": index, "id": item_ids.get(index), "errors": messages}
+        for index, messages in sorted(errors.items())
+    ]
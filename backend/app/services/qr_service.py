@@ -1,7 +1,28 @@
+import hashlib
 import io
+import os
+import tempfile
+from pathlib import Path
 
 import qrcode
+from PIL import Image, ImageDraw, ImageFont
 from qrcode.image.pil import PilImage
+from qrcode.image.svg import SvgPathImage
+
+from app.core.concurrency import WorkerPool
+from app.core.config import settings
+
+# Bump when rendering changes so cached files and client ETags roll over.
+QR_RENDER_VERSION = "1"
+
+QR_MEDIA_TYPES = {"png": "image/png", "svg": "image/svg+xml"}
+
+qr_pool = WorkerPool("qr", settings.QR_RENDER_WORKERS)
+
+LABEL_CELL_WIDTH = 300
+LABEL_QR_SIZE = 240
+LABEL_CELL_HEIGHT = 320
+LABEL_PAGE_SIZE = (1240, 1754)  # A4 at 150 dpi
 
 
 def generate_qr_code(data: str, box_size: int = 10, border: int = 4) -> bytes:
@@ -12,3 +33,128 @@ def generate_qr_code(data: str, box_size: int = 10, border: int = 4) -> bytes:
     buf = io.BytesIO()
     img.save(buf, format="PNG")
     return buf.getvalue()
+
+
+def generate_qr_svg(data: str, box_size: int = 10, border: int = 4) -> bytes:
+    qr = qrcode.QRCode(version=1, box_size=box_size, border=border)
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(image_factory=SvgPathImage)
+    buf = io.BytesIO()
+    img.save(buf)
+    return buf.getvalue()
+
+
+def qr_cache_key(data: str, box_size: int, border: int, fmt: str) -> str:
+    raw = f"{QR_RENDER_VERSION}:{fmt}:{box_size}:{border}:{data}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _render(data: str, box_size: int, border: int, fmt: str) -> bytes:
+    if fmt == "svg":
+        return generate_qr_svg(data, box_size, border)
+    return generate_qr_code(data, box_size, border)
+
+
+def _prune_cache(cache_dir: Path, max_files: int) -> None:
+    # Drops the oldest renders once the directory outgrows max_files, leaving
+    # headroom so a busy cache does not rescan on every write.
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                continue
+    if len(entries) <= max_files:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - max_files * 9 // 10]:
+        Path(path).unlink(missing_ok=True)
+
+
+def _render_cached(data: str, box_size: int, border: int, fmt: str) -> bytes:
+    cache_dir = Path(settings.QR_CACHE_DIR)
+    path = cache_dir / f"{qr_cache_key(data, box_size, border, fmt)}.{fmt}"
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pass
+
+    content = _render(data, box_size, border, fmt)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+        _prune_cache(cache_dir, settings.QR_CACHE_MAX_FILES)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+    return content
+
+
+async def render_qr(
+    data: str, *, box_size: int = 10, border: int = 4, fmt: str = "png", cache: bool = True
+) -> bytes:
+    # Only pass cache=True for codes that exist; arbitrary input must not be
+    # able to grow the cache directory.
+    render = _render_cached if cache else _render
+    return await qr_pool.run(render, data, box_size, border, fmt)
+
+
+def _label_cell(qr_code_id: str, title: str, font: ImageFont.ImageFont) -> Image.Image:
+    cell = Image.new("RGB", (LABEL_CELL_WIDTH, LABEL_CELL_HEIGHT), "white")
+    qr = qrcode.QRCode(box_size=10, border=2)
+    qr.add_data(qr_code_id)
+    qr.make(fit=True)
+    qr_img = qr.make_image(fill_color="black", back_color="white").get_image().convert("RGB")
+    qr_img = qr_img.resize((LABEL_QR_SIZE, LABEL_QR_SIZE), Image.Resampling.NEAREST)
+    cell.paste(qr_img, ((LABEL_CELL_WIDTH - LABEL_QR_SIZE) // 2, 8))
+
+    draw = ImageDraw.Draw(cell)
+    y = LABEL_QR_SIZE + 14
+    for line in (qr_code_id, title[:28]):
+        try:
+            draw.text((LABEL_CELL_WIDTH // 2, y), line, fill="black", font=font, anchor="ma")
+        except (UnicodeEncodeError, ValueError):
+            # Bitmap fallback font cannot draw every script; keep the QR usable.
+            continue
+        y += 24
+    return cell
+
+
+def _compose(cells: list[Image.Image], columns: int, size: tuple[int, int]) -> Image.Image:
+    sheet = Image.new("RGB", size, "white")
+    for index, cell in enumerate(cells):
+        row, col = divmod(index, columns)
+        sheet.paste(cell, (col * LABEL_CELL_WIDTH, row * LABEL_CELL_HEIGHT))
+    return sheet
+
+
+def generate_label_sheet(labels: list[tuple[str, str]], columns: int, fmt: str) -> bytes:
+    try:
+        font = ImageFont.load_default(size=18)
+    except TypeError:
+        font = ImageFont.load_default()
+    cells = [_label_cell(qr_code_id, title, font) for qr_code_id, title in labels]
+    buf = io.BytesIO()
+
+    if fmt == "pdf":
+        page_w, page_h = LABEL_PAGE_SIZE
+        columns = min(columns, page_w // LABEL_CELL_WIDTH)
+        per_page = columns * (page_h // LABEL_CELL_HEIGHT)
+        pages = [
+            _compose(cells[i : i + per_page], columns, LABEL_PAGE_SIZE)
+            for i in range(0, len(cells), per_page)
+        ]
+        pages[0].save(buf, format="PDF", save_all=True, append_images=pages[1:], resolution=150)
+    else:
+        rows = -(-len(cells) // columns)
+        size = (columns * LABEL_CELL_WIDTH, rows * LABEL_CELL_HEIGHT)
+        _compose(cells, columns, size).save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+async def render_label_sheet(labels: list[tuple[str, str]], *, columns: int, fmt: str) -> bytes:
+    return await qr_pool.run(generate_label_sheet, labels, columns, fmt)
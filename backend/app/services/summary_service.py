@@ -0,0 +1,50 @@
+import asyncio
+import logging
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import async_session_factory
+from app.repositories.item_repository import ItemRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryFolder:
+    # Periodically folds item_summary_delta into item_summary so the delta
+    # table stays small. Every worker runs one; the fold function lets only
+    # one of them work at a time.
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def fold(self) -> int:
+        async with async_session_factory() as session:
+            folded = await ItemRepository(session).fold_summary()
+            await session.commit()
+            return folded
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.fold()
+            except (SQLAlchemyError, OSError) as e:
+                logger.warning("Item summary fold failed: %s", e)
+
+    def start(self) -> None:
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+summary_folder = SummaryFolder(settings.ITEM_SUMMARY_FOLD_SECONDS)
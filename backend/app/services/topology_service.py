@@ -10,18 +10,12 @@ class TopologyService:
 
     async def get_topology(self, item_id: UUID) -> list[dict]:
         query = text("""
-            WITH RECURSIVE topology AS (
-                SELECT id, name, category, status, parent_item_id,
-                       item_type, quantity, unit, attributes, 0 AS depth
-                FROM items WHERE id = :item_id
-                UNION ALL
-                SELECT i.id, i.name, i.category, i.status, i.parent_item_id,
-                       i.item_type, i.quantity, i.unit, i.attributes, t.depth + 1
-                FROM items i
-                JOIN topology t ON i.parent_item_id = t.id
-                WHERE t.depth < 20
-            )
-            SELECT * FROM topology ORDER BY depth, name;
+            SELECT i.id, i.name, i.category, i.status, i.parent_item_id,
+                   i.item_type, i.quantity, i.unit, i.attributes, c.depth
+            FROM item_closure c
+            JOIN items i ON i.id = c.descendant_id
+            WHERE c.ancestor_id = :item_id
+            ORDER BY c.depth, i.name;
         """)
         result = await self.db.execute(query, {"item_id": str(item_id)})
         rows = result.mappings().all()
@@ -58,3 +52,117 @@ class TopologyService:
                 root = nodes[rid]
 
         return root
+
+    async def get_container_subtree(
+        self, container_id: UUID, max_depth: int | None = None
+    ) -> list[dict]:
+        # The closure table gives the whole subtree in one indexed lookup;
+        # totals roll up over every descendant even when the listing is
+        # truncated at max_depth.
+        query = text("""
+            WITH subtree AS (
+                SELECT c.id, c.name, c.location, c.qr_code_id, c.parent_container_id,
+                       cc.depth
+                FROM container_closure cc
+                JOIN containers c ON c.id = cc.descendant_id
+                WHERE cc.ancestor_id = :container_id
+            ),
+            direct AS (
+                SELECT i.container_id,
+                       count(*) AS item_count,
+                       COALESCE(sum(i.unit_price * i.quantity), 0) AS total_value,
+                       count(*) FILTER (
+                           WHERE i.item_type = 'consumable'
+                             AND i.min_stock IS NOT NULL
+                             AND i.quantity < i.min_stock
+                       ) AS low_stock_count
+                FROM items i
+                JOIN subtree s ON i.container_id = s.id
+                GROUP BY i.container_id
+            ),
+            tree AS (
+                SELECT * FROM subtree
+                WHERE CAST(:max_depth AS integer) IS NULL OR depth <= :max_depth
+            ),
+            rollup AS (
+                SELECT link.ancestor_id,
+                       sum(d.item_count) AS item_count,
+                       sum(d.total_value) AS total_value,
+                       sum(d.low_stock_count) AS low_stock_count
+                FROM tree t
+                JOIN container_closure link ON link.ancestor_id = t.id
+                JOIN direct d ON d.container_id = link.descendant_id
+                GROUP BY link.ancestor_id
+            )
+            SELECT t.id, t.name, t.location, t.qr_code_id, t.parent_container_id, t.depth,
+                   COALESCE(d.item_count, 0) AS direct_item_count,
+                   COALESCE(d.total_value, 0) AS direct_total_value,
+                   COALESCE(d.low_stock_count, 0) AS direct_low_stock_count,
+                   COALESCE(r.item_count, 0) AS item_count,
+                   COALESCE(r.total_value, 0) AS total_value,
+                   COALESCE(r.low_stock_count, 0) AS low_stock_count
+            FROM tree t
+            LEFT JOIN direct d ON d.container_id = t.id
+            LEFT JOIN rollup r ON r.ancestor_id = t.id
+            ORDER BY t.depth, t.name;
+        """)
+        result = await self.db.execute(
+            query, {"container_id": str(container_id), "max_depth": max_depth}
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    async def get_item_ancestors(self, item_id: UUID) -> list[dict]:
+        return await self._ancestors("items", "item_closure", item_id)
+
+    async def get_container_ancestors(self, container_id: UUID) -> list[dict]:
+        return await self._ancestors("containers", "container_closure", container_id)
+
+    async def _ancestors(self, table: str, closure: str, node_id: UUID) -> list[dict]:
+        query = text(f"""
+            SELECT n.id, n.name, c.depth
+            FROM {closure} c
+            JOIN {table} n ON n.id = c.ancestor_id
+            WHERE c.descendant_id = :node_id AND c.depth > 0
+            ORDER BY c.depth DESC;
+        """)
+        result = await self.db.execute(query, {"node_id": str(node_id)})
+        return [
+            {"id": str(row["id"]), "name": row["name"], "depth": row["depth"]}
+            for row in result.mappings().all()
+        ]
+
+    async def get_container_tree(
+        self, container_id: UUID, max_depth: int | None = None
+    ) -> dict | None:
+        flat = await self.get_container_subtree(container_id, max_depth)
+        if not flat:
+            return None
+
+        nodes = {}
+        for row in flat:
+            rid = str(row["id"])
+            nodes[rid] = {
+                "id": rid,
+                "name": row["name"],
+                "location": row["location"],
+                "qr_code_id": row["qr_code_id"],
+                "depth": row["depth"],
+                "item_count": int(row["item_count"]),
+                "total_value": float(row["total_value"]),
+                "low_stock_count": int(row["low_stock_count"]),
+                "direct_item_count": int(row["direct_item_count"]),
+                "direct_total_value": float(row["direct_total_value"]),
+                "direct_low_stock_count": int(row["direct_low_stock_count"]),
+                "children": [],
+            }
+
+        root = None
+        for row in flat:
+            rid = str(row["id"])
+            pid = str(row["parent_container_id"]) if row["parent_container_id"] else None
+            if row["depth"] == 0:
+                root = nodes[rid]
+            elif pid in nodes:
+                nodes[pid]["children"].append(nodes[rid])
+
+        return root
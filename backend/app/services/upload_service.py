@@ -0,0 +1,185 @@
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import HTTPException, Request, status
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+UPLOAD_DIR = Path(settings.UPLOAD_DIR)
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+@dataclass
+class ReceivedFile:
+    path: Path
+    filename: str
+    content_type: str
+    size: int
+
+    @property
+    def extension(self) -> str:
+        return os.path.splitext(self.filename)[1].lower()
+
+
+class _PartEvents:
+    def __init__(self):
+        self.events: list[tuple[str, object]] = []
+        self._field = bytearray()
+        self._value = bytearray()
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": lambda: self.events.append(("begin", None)),
+            "on_header_field": lambda d, s, e: self._field.extend(d[s:e]),
+            "on_header_value": lambda d, s, e: self._value.extend(d[s:e]),
+            "on_header_end": self._header_end,
+            "on_headers_finished": lambda: self.events.append(("headers", None)),
+            "on_part_data": lambda d, s, e: self.events.append(("data", bytes(d[s:e]))),
+            "on_part_end": lambda: self.events.append(("end", None)),
+        }
+
+    def _header_end(self) -> None:
+        self.events.append(("header", (bytes(self._field).lower(), bytes(self._value))))
+        self._field.clear()
+        self._value.clear()
+
+    def drain(self) -> list[tuple[str, object]]:
+        events, self.events = self.events, []
+        return events
+
+
+def _open_temp(directory: Path, suffix: str):
+    directory.mkdir(parents=True, exist_ok=True)
+    return tempfile.NamedTemporaryFile(
+        dir=directory, prefix=".upload-", suffix=suffix, delete=False
+    )
+
+
+def _discard(fh) -> None:
+    fh.close()
+    Path(fh.name).unlink(missing_ok=True)
+
+
+async def receive_file(
+    request: Request,
+    *,
+    field: str = "file",
+    max_size: int,
+    allowed_extensions: set[str],
+    content_type_prefix: str = "",
+    directory: Path = UPLOAD_DIR,
+) -> ReceivedFile:
+    # Parses the request body as it arrives and spools the file part straight to
+    # a temp file; callers own (and must move or remove) the returned path.
+    mime, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if mime != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected multipart/form-data upload")
+
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File too large (max {max_size // (1024 * 1024)}MB)",
+    )
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > max_size + MULTIPART_OVERHEAD:
+            raise too_large
+
+    collector = _PartEvents()
+    parser = MultipartParser(boundary, collector.callbacks())
+    headers: dict[bytes, bytes] = {}
+    target = None
+    result: ReceivedFile | None = None
+    size = 0
+
+    async def process(events: list[tuple[str, object]]) -> None:
+        nonlocal headers, target, result, size
+        pending = bytearray()
+        for kind, payload in events:
+            if kind == "begin":
+                headers = {}
+            elif kind == "header":
+                name, value = payload
+                headers[name] = value
+            elif kind == "headers" and result is None:
+                _, options = parse_options_header(headers.get(b"content-disposition", b""))
+                if options.get(b"name", b"").decode() != field or b"filename" not in options:
+                    continue
+                filename = options[b"filename"].decode("utf-8", "replace")
+                part_type = headers.get(b"content-type", b"").decode("latin-1")
+                ext = os.path.splitext(filename)[1].lower()
+                if content_type_prefix and not part_type.startswith(content_type_prefix):
+                    raise HTTPException(status_code=400, detail="File must be an image")
+                if ext not in allowed_extensions:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Allowed formats: {', '.join(sorted(allowed_extensions))}",
+                    )
+                target = await run_in_threadpool(_open_temp, directory, ext)
+                result = ReceivedFile(Path(target.name), filename, part_type, 0)
+            elif kind == "data" and target is not None:
+                size += len(payload)
+                if size > max_size:
+                    raise too_large
+                pending += payload
+            elif kind == "end" and target is not None:
+                if pending:
+                    await run_in_threadpool(target.write, bytes(pending))
+                    pending.clear()
+                await run_in_threadpool(target.close)
+                result.size = size
+                target = None
+        if pending and target is not None:
+            await run_in_threadpool(target.write, bytes(pending))
+
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            await process(collector.drain())
+        parser.finalize()
+        await process(collector.drain())
+    except BaseException as e:
+        if target is not None:
+            await run_in_threadpool(_discard, target)
+        elif result is not None:
+            await run_in_threadpool(_remove, result.path)
+        if isinstance(e, MultipartParseError):
+            raise HTTPException(status_code=400, detail="Malformed multipart body") from e
+        raise
+
+    if result is None:
+        raise HTTPException(status_code=400, detail=f"No '{field}' file in upload")
+    if target is not None:
+        await run_in_threadpool(_discard, target)
+        raise HTTPException(status_code=400, detail="Incomplete multipart upload")
+    return result
+
+
+def _remove(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+async def discard(received: ReceivedFile) -> None:
+    await run_in_threadpool(_remove, received.path)
+
+
+async def remove_upload(url: str | None) -> None:
+    if url:
+        await run_in_threadpool(_remove, UPLOAD_DIR / os.path.basename(url))
+
+
+def _publish(source: Path, destination: Path) -> None:
+    # mkstemp creates files as 0600; published uploads are world-readable.
+    os.chmod(source, 0o644)
+    os.replace(source, destination)
+
+
+async def store_upload(received: ReceivedFile, filename: str) -> Path:
+    destination = UPLOAD_DIR / filename
+    await run_in_threadpool(_publish, received.path, destination)
+    return destination
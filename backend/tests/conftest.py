@@ -0,0 +1,75 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+# Settings are read at import time, so point the app at the test database
+# (and away from Redis and shared caches) before anything imports it.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ["REDIS_URL"] = ""
+os.environ["CACHE_ENABLED"] = "false"
+os.environ["AUTH_USER_CACHE_TTL_SECONDS"] = "0"
+os.environ["ITEM_SUMMARY_FOLD_SECONDS"] = "0"
+os.environ["ALERT_SINKS"] = "log"
+_scratch = tempfile.mkdtemp(prefix="nexus-tests-")
+os.environ["UPLOAD_DIR"] = os.path.join(_scratch, "uploads")
+os.environ["QR_CACHE_DIR"] = os.path.join(_scratch, "qr")
+
+import httpx  # noqa: E402
+from sqlalchemy import event, text  # noqa: E402
+
+from app.core.database import Base, engine  # noqa: E402
+
+
+def pytest_collection_modifyitems(config, items):
+    if TEST_DATABASE_URL:
+        return
+    skip = pytest.mark.skip(reason="set TEST_DATABASE_URL to a disposable PostgreSQL database")
+    for item in items:
+        if "postgres" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def client():
+    # Every test starts from an empty schema; the database is dropped and
+    # recreated, so never point TEST_DATABASE_URL at real data.
+    from app.main import app
+
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.drop_all)
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            response = await http.post(
+                "/api/v1/auth/login", json={"username": "admin", "password": "admin123"}
+            )
+            response.raise_for_status()
+            http.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+            yield http
+
+    await engine.dispose()
+
+
+@contextmanager
+def count_queries():
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
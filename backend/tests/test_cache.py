@@ -0,0 +1,52 @@
+import pytest
+
+from app.core.cache import ITEMS_TAG, MISSING, LocalCache, ResponseCache
+
+pytestmark = pytest.mark.anyio
+
+
+def _local_cache() -> ResponseCache:
+    return ResponseCache(None, prefix="test", default_ttl=60, local_max_entries=2)
+
+
+async def test_fill_started_before_invalidation_is_not_kept():
+    cache = _local_cache()
+
+    async def load() -> str:
+        # A write commits and invalidates while this value is being built.
+        await cache.invalidate_tags(ITEMS_TAG)
+        return "stale"
+
+    assert await cache.get_or_set("report", load, tags=(ITEMS_TAG,)) == "stale"
+
+    async def reload() -> str:
+        return "fresh"
+
+    assert await cache.get_or_set("report", reload, tags=(ITEMS_TAG,)) == "fresh"
+
+
+def test_evicted_and_expired_keys_leave_no_tag_entries():
+    local = LocalCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        local.set(key, key, ttl=60, tags=(ITEMS_TAG,))
+    assert local._tags[ITEMS_TAG] == {"b", "c"}
+
+    local.set("b", "b", ttl=-1, tags=(ITEMS_TAG,))
+    assert local.get("b") is MISSING
+    assert local._tags[ITEMS_TAG] == {"c"}
+
+    local.delete("c")
+    assert ITEMS_TAG not in local._tags
+
+
+async def test_misses_are_not_cached_when_cache_none_is_off():
+    cache = _local_cache()
+    calls = []
+
+    async def load() -> None:
+        calls.append(1)
+        return None
+
+    for _ in range(2):
+        assert await cache.get_or_set("user", load, cache_none=False) is None
+    assert len(calls) == 2
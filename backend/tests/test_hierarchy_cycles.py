@@ -0,0 +1,82 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.database import async_session_factory
+from app.models.hierarchy import ContainerClosure, ItemClosure
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+PAIRS = 20
+
+
+async def _self_loops(closure) -> int:
+    # A cycle shows up as a node being its own ancestor at depth > 0.
+    async with async_session_factory() as session:
+        q = (
+            select(func.count())
+            .select_from(closure)
+            .where(closure.ancestor_id == closure.descendant_id, closure.depth > 0)
+        )
+        return (await session.execute(q)).scalar()
+
+
+async def _create(client, url: str, payload: dict) -> str:
+    response = await client.post(url, json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+async def test_crossing_container_moves_cannot_both_commit(client):
+    pairs = [
+        [
+            await _create(
+                client,
+                "/api/v1/containers",
+                {"name": f"box {i}{side}", "qr_code_id": f"QR-{uuid.uuid4().hex[:12]}"},
+            )
+            for side in "ab"
+        ]
+        for i in range(PAIRS)
+    ]
+
+    responses = await asyncio.gather(
+        *(
+            client.patch(f"/api/v1/containers/{child}", json={"parent_container_id": parent})
+            for a, b in pairs
+            for child, parent in ((a, b), (b, a))
+        )
+    )
+    statuses = [r.status_code for r in responses]
+    # Per pair exactly one move wins; the other is refused as a cycle.
+    for index in range(PAIRS):
+        assert sorted(statuses[2 * index : 2 * index + 2]) == [200, 400]
+    assert await _self_loops(ContainerClosure) == 0
+
+
+async def test_crossing_item_moves_cannot_both_commit(client):
+    pairs = [
+        [
+            await _create(
+                client,
+                "/api/v1/items",
+                {"name": f"asset {i}{side}", "item_type": "asset", "category": "server"},
+            )
+            for side in "ab"
+        ]
+        for i in range(PAIRS)
+    ]
+
+    responses = await asyncio.gather(
+        *(
+            client.patch(f"/api/v1/items/{child}/move", json={"parent_item_id": parent})
+            for a, b in pairs
+            for child, parent in ((a, b), (b, a))
+        )
+    )
+    statuses = [r.status_code for r in responses]
+    for index in range(PAIRS):
+        assert sorted(statuses[2 * index : 2 * index + 2]) == [200, 400]
+    assert await _self_loops(ItemClosure) == 0
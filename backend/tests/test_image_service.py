@@ -0,0 +1,29 @@
+import time
+
+import pytest
+
+from app.services import image_service
+from app.services.image_service import finish_builds, remove_image, schedule_variants
+from app.services.upload_service import UPLOAD_DIR
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_remove_waits_for_pending_variant_build(monkeypatch):
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    (UPLOAD_DIR / "photo.png").write_bytes(b"png")
+
+    def slow_generate(source, *, force=False):
+        # Stands in for a resize that is still running when removal starts.
+        time.sleep(0.2)
+        variant = source.with_name(image_service.variant_filename(source.name, "thumb"))
+        variant.write_bytes(b"webp")
+        return [variant]
+
+    monkeypatch.setattr(image_service, "generate_variants", slow_generate)
+    schedule_variants("/uploads/photo.png")
+    await remove_image("/uploads/photo.png")
+    await finish_builds()
+
+    # A build finishing after the removal would leave an orphaned rendition.
+    assert list(UPLOAD_DIR.iterdir()) == []
@@ -0,0 +1,105 @@
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from app.core.database import async_session_factory
+from app.models.container import Container
+from app.models.item import Item
+from tests.conftest import count_queries
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+
+@dataclass
+class Tree:
+    container_id: uuid.UUID
+    item_id: uuid.UUID
+    qr_code_id: str
+
+
+async def seed_tree(depth: int) -> Tree:
+    # A container chain and an item chain `depth` levels deep, plus `depth`
+    # consumables, so every read endpoint has nested data to (not) load.
+    async with async_session_factory() as session:
+        containers = []
+        parent_id = None
+        for level in range(depth + 1):
+            container = Container(
+                id=uuid.uuid4(),
+                name=f"box {level}",
+                qr_code_id=f"QR-{uuid.uuid4().hex[:12]}",
+                parent_container_id=parent_id,
+            )
+            session.add(container)
+            await session.flush()
+            containers.append(container)
+            parent_id = container.id
+
+        parent_item_id = None
+        items = []
+        for level in range(depth + 1):
+            item = Item(
+                id=uuid.uuid4(),
+                name=f"asset {level}",
+                item_type="asset",
+                category="server",
+                quantity=1,
+                container_id=containers[level].id,
+                parent_item_id=parent_item_id,
+            )
+            session.add(item)
+            await session.flush()
+            items.append(item)
+            parent_item_id = item.id
+
+        for index in range(depth):
+            session.add(
+                Item(
+                    name=f"consumable {index}",
+                    item_type="consumable",
+                    category="supplies",
+                    quantity=1,
+                    min_stock=5,
+                    container_id=containers[0].id,
+                    status="loaned" if index % 2 else "in_stock",
+                )
+            )
+        await session.commit()
+        return Tree(containers[0].id, items[0].id, containers[0].qr_code_id)
+
+
+ENDPOINTS = {
+    "items_list": lambda t: "/api/v1/items",
+    "items_list_cursor": lambda t: "/api/v1/items?pagination=cursor",
+    "items_list_facets": lambda t: "/api/v1/items?facets=category,status,item_type",
+    "item_detail": lambda t: f"/api/v1/items/{t.item_id}",
+    "containers_list": lambda t: "/api/v1/containers",
+    "container_detail": lambda t: f"/api/v1/containers/{t.container_id}",
+    "scan": lambda t: f"/api/v1/scan/{t.qr_code_id}",
+    "item_topology": lambda t: f"/api/v1/topology/{t.item_id}",
+    "item_ancestors": lambda t: f"/api/v1/topology/{t.item_id}/ancestors",
+    "container_topology": lambda t: f"/api/v1/topology/containers/{t.container_id}",
+    "container_ancestors": lambda t: f"/api/v1/topology/containers/{t.container_id}/ancestors",
+    "low_stock_report": lambda t: "/api/v1/reports/low-stock",
+    "loaned_report": lambda t: "/api/v1/reports/loaned",
+    "summary_report": lambda t: "/api/v1/reports/summary",
+}
+
+
+async def _count(client, url: str) -> int:
+    with count_queries() as statements:
+        response = await client.get(url)
+    assert response.status_code == 200, response.text
+    return len(statements)
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+async def test_query_count_does_not_grow_with_data(client, endpoint):
+    url = ENDPOINTS[endpoint]
+    shallow = await seed_tree(depth=2)
+    await client.get(url(shallow))  # warm up connection and dialect setup
+    baseline = await _count(client, url(shallow))
+
+    deep = await seed_tree(depth=12)
+    assert await _count(client, url(deep)) == baseline
@@ -0,0 +1,60 @@
+import asyncio
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.database import async_session_factory
+from app.models.stock_movement import StockMovement
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+STARTING_QUANTITY = 100
+ATTEMPTS = 300
+
+
+async def test_parallel_adjusts_never_lose_updates(client):
+    response = await client.post(
+        "/api/v1/items",
+        json={
+            "name": "cable ties",
+            "item_type": "consumable",
+            "category": "supplies",
+            "quantity": STARTING_QUANTITY,
+        },
+    )
+    assert response.status_code == 201, response.text
+    item_id = uuid.UUID(response.json()["id"])
+
+    responses = await asyncio.gather(
+        *(
+            client.post(f"/api/v1/items/{item_id}/adjust", json={"delta": -1, "note": f"pick {i}"})
+            for i in range(ATTEMPTS)
+        )
+    )
+    statuses = [r.status_code for r in responses]
+    # Exactly the available stock is handed out; the rest hit the guard.
+    assert statuses.count(200) == STARTING_QUANTITY
+    assert statuses.count(400) == ATTEMPTS - STARTING_QUANTITY
+
+    item = (await client.get(f"/api/v1/items/{item_id}")).json()
+    assert Decimal(str(item["quantity"])) == 0
+
+    async with async_session_factory() as session:
+        count, total = (
+            await session.execute(
+                select(func.count(), func.sum(StockMovement.delta)).where(
+                    StockMovement.item_id == item_id
+                )
+            )
+        ).one()
+        after = (
+            await session.scalars(
+                select(StockMovement.quantity_after).where(StockMovement.item_id == item_id)
+            )
+        ).all()
+    assert count == STARTING_QUANTITY
+    assert total == -STARTING_QUANTITY
+    # Each successful adjust saw its own committed balance.
+    assert sorted(after) == list(range(STARTING_QUANTITY))
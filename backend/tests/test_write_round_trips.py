@@ -0,0 +1,81 @@
+import re
+
+import pytest
+
+from tests.conftest import count_queries
+
+pytestmark = [pytest.mark.anyio, pytest.mark.postgres]
+
+
+def _reads_after_write(statements: list[str], table: str) -> list[str]:
+    # Server defaults come back through RETURNING on the write itself, so
+    # nothing should be read back once the INSERT or UPDATE has gone out.
+    write = re.compile(rf"\s*(INSERT INTO|UPDATE) {table}\b")
+    index = next(i for i, s in enumerate(statements) if write.match(s))
+    assert "RETURNING" in statements[index]
+    return [s for s in statements[index + 1 :] if s.lstrip().upper().startswith("SELECT")]
+
+
+async def _create_item(client) -> dict:
+    response = await client.post(
+        "/api/v1/items",
+        json={"name": "patch cable", "item_type": "consumable", "category": "network"},
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def _create_container(client) -> dict:
+    response = await client.post(
+        "/api/v1/containers", json={"name": "spares", "qr_code_id": "CTN-RT-001"}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+async def test_create_item_has_no_read_back(client):
+    with count_queries() as statements:
+        item = await _create_item(client)
+    assert item["created_at"] and item["updated_at"]
+    assert _reads_after_write(statements, "items") == []
+
+
+async def test_update_item_has_no_read_back(client):
+    item = await _create_item(client)
+    with count_queries() as statements:
+        response = await client.patch(f"/api/v1/items/{item['id']}", json={"name": "fiber"})
+    assert response.status_code == 200, response.text
+    assert response.json()["updated_at"] >= item["updated_at"]
+    assert _reads_after_write(statements, "items") == []
+
+
+async def test_create_container_has_no_read_back(client):
+    with count_queries() as statements:
+        container = await _create_container(client)
+    assert container["created_at"]
+    assert _reads_after_write(statements, "containers") == []
+
+
+async def test_update_container_has_no_read_back(client):
+    container = await _create_container(client)
+    with count_queries() as statements:
+        response = await client.patch(
+            f"/api/v1/containers/{container['id']}", json={"name": "spare parts"}
+        )
+    assert response.status_code == 200, response.text
+    assert _reads_after_write(statements, "containers") == []
+
+
+async def test_update_user_has_no_read_back(client):
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"username": "tech", "email": "tech@example.com", "password": "hunter22"},
+    )
+    assert response.status_code == 201, response.text
+    user_id = response.json()["id"]
+
+    with count_queries() as statements:
+        response = await client.patch(f"/api/v1/auth/users/{user_id}", json={"role": "viewer"})
+    assert response.status_code == 200, response.text
+    assert response.json()["role"] == "viewer"
+    assert _reads_after_write(statements, "users") == []
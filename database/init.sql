@@ -80,6 +80,11 @@ CREATE INDEX IF NOT EXISTS ix_containers_parent ON containers(parent_container_i
 CREATE INDEX IF NOT EXISTS ix_users_username ON users(username);
 CREATE INDEX IF NOT EXISTS ix_users_email ON users(email);
 
+-- Everything added after this baseline (search and keyset indexes, the
+-- summary rollup, stock movements, closure tables) comes from the Alembic
+-- migrations; alembic upgrade head runs on backend startup and backfills the
+-- seed rows below.
+
 -- Admin user is auto-created by the backend on first startup (password: admin123)
 
 -- Seed: sample containers
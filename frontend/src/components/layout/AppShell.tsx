@@ -2,9 +2,11 @@ import { useState } from "react";
 import { Outlet } from "react-router-dom";
 import { Header } from "./Header";
 import { Sidebar } from "./Sidebar";
+import { useWebSocket } from "@/hooks/useWebSocket";
 
 export function AppShell() {
   const [sidebarOpen, setSidebarOpen] = useState(false);
+  useWebSocket();
 
   return (
     <div className="flex h-screen overflow-hidden">
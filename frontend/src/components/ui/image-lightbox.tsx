@@ -1,4 +1,4 @@
-import { useEffect } from "react";
+import { useEffect, useState } from "react";
 import { X } from "lucide-react";
 import { cn } from "@/lib/utils";
 
@@ -54,13 +54,18 @@ export function ImageLightbox({ src, alt, open, onClose }: ImageLightboxProps) {
 
 interface ItemThumbnailProps {
   src?: string | null;
+  fallbackSrc?: string | null;
   alt?: string;
   className?: string;
   size?: number;
 }
 
-export function ItemThumbnail({ src, alt, className, size = 40 }: ItemThumbnailProps) {
-  if (!src) {
+export function ItemThumbnail({ src, fallbackSrc, alt, className, size = 40 }: ItemThumbnailProps) {
+  const [failed, setFailed] = useState(false);
+  useEffect(() => setFailed(false), [src]);
+  const shown = failed ? fallbackSrc : src || fallbackSrc;
+
+  if (!shown) {
     return (
       <div
         className={cn(
@@ -87,8 +92,10 @@ export function ItemThumbnail({ src, alt, className, size = 40 }: ItemThumbnailP
 
   return (
     <img
-      src={src}
+      src={shown}
       alt={alt || ""}
+      loading="lazy"
+      onError={() => !failed && fallbackSrc && setFailed(true)}
       className={cn("rounded-md object-cover", className)}
       style={{ width: size, height: size, minWidth: size, minHeight: size }}
     />
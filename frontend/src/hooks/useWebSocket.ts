@@ -1,46 +1,86 @@
 import { useEffect, useRef } from "react";
+import { useTranslation } from "react-i18next";
+import { toast } from "./use-toast";
+import { useAuthStore } from "../stores/authStore";
 import { useInventoryStore } from "../stores/inventoryStore";
 
+const MAX_RECONNECT_DELAY = 30000;
+
 export function useWebSocket() {
+  const { t } = useTranslation();
   const wsRef = useRef<WebSocket | null>(null);
+  const token = useAuthStore((s) => s.token);
   const updateItem = useInventoryStore((s) => s.updateItem);
   const removeItem = useInventoryStore((s) => s.removeItem);
   const fetchItems = useInventoryStore((s) => s.fetchItems);
 
   useEffect(() => {
-    const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
-    const ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
-    wsRef.current = ws;
-
-    ws.onmessage = (event) => {
-      try {
-        const message = JSON.parse(event.data);
-        switch (message.type) {
-          case "item_updated":
-            updateItem(message.payload);
-            break;
-          case "item_deleted":
-            removeItem(message.payload.id);
-            break;
-          case "inventory_changed":
-            fetchItems();
-            break;
-        }
-      } catch {
-        // ignore malformed messages
-      }
-    };
+    if (!token) return;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+    let attempts = 0;
+    let disposed = false;
+
+    const connect = () => {
+      const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+      const ws = new WebSocket(
+        `${protocol}//${window.location.host}/ws?token=${encodeURIComponent(token)}`
+      );
+      wsRef.current = ws;
 
-    ws.onclose = () => {
-      setTimeout(() => {
-        if (wsRef.current === ws) {
-          wsRef.current = null;
+      ws.onopen = () => {
+        // Events published while disconnected are gone; resync once.
+        if (attempts > 0) fetchItems();
+        attempts = 0;
+      };
+
+      ws.onmessage = (event) => {
+        try {
+          const message = JSON.parse(event.data);
+          switch (message.type) {
+            case "item_updated":
+              updateItem(message.payload);
+              break;
+            case "item_deleted":
+              removeItem(message.payload.id);
+              break;
+            case "inventory_changed":
+              fetchItems();
+              break;
+            case "stock_alert": {
+              const alert = message.payload;
+              toast({
+                title:
+                  alert.kind === "low_stock"
+                    ? t("reports.alertLowStock", {
+                        name: alert.name,
+                        quantity: alert.quantity,
+                        min: alert.min_stock,
+                      })
+                    : t("reports.alertRestocked", { name: alert.name }),
+                variant: alert.kind === "low_stock" ? "destructive" : "default",
+              });
+              break;
+            }
+          }
+        } catch {
+          // ignore malformed messages
         }
-      }, 3000);
+      };
+
+      ws.onclose = () => {
+        if (wsRef.current === ws) wsRef.current = null;
+        if (disposed) return;
+        attempts += 1;
+        retryTimer = setTimeout(connect, Math.min(MAX_RECONNECT_DELAY, 1000 * 2 ** attempts));
+      };
     };
 
+    connect();
+
     return () => {
-      ws.close();
+      disposed = true;
+      clearTimeout(retryTimer);
+      wsRef.current?.close();
     };
-  }, [updateItem, removeItem, fetchItems]);
+  }, [token, updateItem, removeItem, fetchItems, t]);
 }
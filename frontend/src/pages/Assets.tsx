@@ -193,10 +193,12 @@ export default function Assets() {
                     }}
                   >
                     {item.image_url ? (
-                      <img
-                        src={item.image_url}
+                      <ItemThumbnail
+                        src={item.thumbnail_url}
+                        fallbackSrc={item.image_url}
                         alt={item.name}
-                        className="h-[120px] w-[120px] object-cover"
+                        size={120}
+                        className="rounded-none"
                       />
                     ) : (
                       <div className="flex h-[120px] w-[120px] items-center justify-center bg-muted">
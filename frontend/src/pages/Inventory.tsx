@@ -142,8 +142,10 @@ export default function Inventory() {
   const {
     items,
     total,
+    facets,
     page,
     pageSize,
+    nextCursor,
     filters,
     loadingItems,
     fetchItems,
@@ -369,6 +371,7 @@ export default function Inventory() {
             {STATUSES.map((s) => (
               <SelectItem key={s} value={s}>
                 {t(`status.${s}`)}
+                {facets.status && ` (${facets.status[s] ?? 0})`}
               </SelectItem>
             ))}
           </SelectContent>
@@ -631,7 +634,7 @@ export default function Inventory() {
                         className="block cursor-pointer"
                         onClick={() => item.image_url && setLightboxSrc(item.image_url)}
                       >
-                        <ItemThumbnail src={item.image_url} alt={item.name} size={40} />
+                        <ItemThumbnail src={item.thumbnail_url} fallbackSrc={item.image_url} alt={item.name} size={40} />
                       </button>
                     </TableCell>
                     <TableCell className="font-medium">{item.name}</TableCell>
@@ -705,7 +708,7 @@ export default function Inventory() {
           <Button
             variant="outline"
             size="sm"
-            disabled={page >= pages}
+            disabled={!nextCursor}
             onClick={() => setPage(page + 1)}
           >
             {t("inventory.next", "Next")}
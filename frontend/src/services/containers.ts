@@ -30,3 +30,12 @@ export async function updateContainer(id: string, container: Partial<Container>)
 export async function deleteContainer(id: string) {
   await api.delete(`/containers/${id}`);
 }
+
+export async function getLabelSheet(containerIds: string[], format: "pdf" | "png" = "pdf", columns = 4) {
+  const { data } = await api.post<Blob>(
+    "/scan/labels",
+    { container_ids: containerIds, format, columns },
+    { responseType: "blob" }
+  );
+  return data;
+}
@@ -8,14 +8,34 @@ export interface ItemFilters {
   container_id?: string;
   low_stock?: boolean;
   search?: string;
+  attr?: string[];
+  facets?: string;
   page?: number;
   page_size?: number;
   sort_by?: string;
   sort_order?: "asc" | "desc";
+  pagination?: "offset" | "cursor";
+  cursor?: string;
 }
 
 export async function getItems(params?: ItemFilters) {
-  const { data } = await api.get<PaginatedResponse<Item>>("/items", { params });
+  const { data } = await api.get<PaginatedResponse<Item>>("/items", {
+    params,
+    paramsSerializer: { indexes: null },
+  });
+  return data;
+}
+
+export interface ItemSearchHit {
+  item: Item;
+  rank: number;
+}
+
+export async function searchItems(
+  q: string,
+  params?: { item_type?: string; category?: string; status?: string; include_details?: boolean; limit?: number }
+) {
+  const { data } = await api.get<ItemSearchHit[]>("/items/search", { params: { q, ...params } });
   return data;
 }
 
@@ -43,6 +63,18 @@ export async function adjustQuantity(id: string, delta: number, note?: string) {
   return data;
 }
 
+export interface BatchAdjustResult {
+  items: Item[];
+  errors: { index: number; id: string | null; errors: string[] }[];
+}
+
+export async function adjustQuantities(
+  adjustments: { item_id: string; delta: number; note?: string }[],
+) {
+  const { data } = await api.post<BatchAdjustResult>("/items/bulk/adjust", { adjustments });
+  return data;
+}
+
 export async function changeStatus(id: string, status: string, assigned_to?: string) {
   const { data } = await api.patch<Item>(`/items/${id}/status`, { status, assigned_to });
   return data;
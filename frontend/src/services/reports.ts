@@ -9,6 +9,16 @@ export interface SummaryData {
   by_status?: Record<string, number>;
 }
 
+export interface AttributeFacet {
+  type: "string" | "number" | "boolean" | "mixed";
+  distinct_values: number;
+  values: { value: string | number | boolean; count: number }[];
+  min?: number;
+  max?: number;
+}
+
+export type AttributeFacets = Record<string, Record<string, AttributeFacet>>;
+
 export async function getLowStock() {
   const { data } = await api.get<Item[]>("/reports/low-stock");
   return data;
@@ -28,3 +38,10 @@ export async function getSummary() {
   const { data } = await api.get<SummaryData>("/reports/summary");
   return data;
 }
+
+export async function getAttributeFacets(category?: string, limit?: number) {
+  const { data } = await api.get<AttributeFacets>("/reports/attribute-facets", {
+    params: { category, limit },
+  });
+  return data;
+}
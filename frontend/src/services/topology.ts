@@ -13,7 +13,29 @@ export interface TopologyNode {
   children: TopologyNode[];
 }
 
+export interface ContainerTopologyNode {
+  id: string;
+  name: string;
+  location: string | null;
+  qr_code_id: string;
+  depth: number;
+  item_count: number;
+  total_value: number;
+  low_stock_count: number;
+  direct_item_count: number;
+  direct_total_value: number;
+  direct_low_stock_count: number;
+  children: ContainerTopologyNode[];
+}
+
 export async function getTopology(itemId: string): Promise<TopologyNode | null> {
   const { data } = await api.get<TopologyNode | null>(`/topology/${itemId}`);
   return data;
 }
+
+export async function getContainerTopology(containerId: string, depth?: number) {
+  const { data } = await api.get<ContainerTopologyNode>(`/topology/containers/${containerId}`, {
+    params: { depth },
+  });
+  return data;
+}
@@ -15,8 +15,12 @@ interface InventoryFilters {
 interface InventoryState {
   items: Item[];
   total: number;
+  facets: Record<string, Record<string, number>>;
   page: number;
   pageSize: number;
+  // cursors[i] fetches page i + 1; pages are walked one step at a time.
+  cursors: (string | undefined)[];
+  nextCursor: string | null;
   containers: Container[];
   filters: InventoryFilters;
   loadingItems: boolean;
@@ -33,19 +37,23 @@ interface InventoryState {
 export const useInventoryStore = create<InventoryState>((set, get) => ({
   items: [],
   total: 0,
+  facets: {},
   page: 1,
   pageSize: 20,
+  cursors: [undefined],
+  nextCursor: null,
   containers: [],
   filters: {},
   loadingItems: false,
   loadingContainers: false,
 
   fetchItems: async () => {
-    const { page, pageSize, filters } = get();
+    const { page, pageSize, cursors, filters } = get();
     set({ loadingItems: true });
     try {
       const params: ItemFilters = {
-        page,
+        pagination: "cursor",
+        cursor: cursors[page - 1],
         page_size: pageSize,
         item_type: filters.itemType,
         category: filters.category,
@@ -53,9 +61,15 @@ export const useInventoryStore = create<InventoryState>((set, get) => ({
         container_id: filters.containerId,
         search: filters.search,
         low_stock: filters.lowStock,
+        facets: "category,status,item_type",
       };
       const result = await getItems(params);
-      set({ items: result.items, total: result.total });
+      set({
+        items: result.items,
+        total: result.total ?? result.items.length,
+        nextCursor: result.next_cursor ?? null,
+        facets: result.facets ?? {},
+      });
     } finally {
       set({ loadingItems: false });
     }
@@ -75,17 +89,25 @@ export const useInventoryStore = create<InventoryState>((set, get) => ({
     set((state) => ({
       filters: { ...state.filters, ...newFilters },
       page: 1,
+      cursors: [undefined],
     }));
     get().fetchItems();
   },
 
   setPage: (page) => {
-    set({ page });
+    const { page: current, cursors, nextCursor } = get();
+    if (page === current + 1 && nextCursor) {
+      set({ page, cursors: [...cursors.slice(0, current), nextCursor] });
+    } else if (page >= 1 && page < current) {
+      set({ page, cursors: cursors.slice(0, page) });
+    } else {
+      return;
+    }
     get().fetchItems();
   },
 
   setPageSize: (pageSize) => {
-    set({ pageSize, page: 1 });
+    set({ pageSize, page: 1, cursors: [undefined] });
     get().fetchItems();
   },
 
@@ -40,15 +40,20 @@ export interface Item {
   restock_url?: string;
   barcode?: string;
   image_url?: string;
+  thumbnail_url?: string | null;
+  medium_url?: string | null;
   created_at: string;
   updated_at: string;
 }
 
 export interface PaginatedResponse<T> {
   items: T[];
-  total: number;
+  total: number | null;
   page: number;
   page_size: number;
+  next_cursor?: string | null;
+  total_estimated?: boolean;
+  facets?: Record<string, Record<string, number>> | null;
 }
 
 export interface ScanResult {
@@ -19,6 +19,11 @@ export default defineConfig({
         target: backendTarget,
         changeOrigin: true,
       },
+      "/ws": {
+        target: backendTarget,
+        changeOrigin: true,
+        ws: true,
+      },
       "/uploads": {
         target: backendTarget,
         changeOrigin: true,